@@ -158,6 +158,11 @@ class IngestionPipeline:
             encoding="utf-8"
         )
 
+        # Also persist the raw text: downstream consumers only need the text
+        # itself, and a plain file avoids parsing the JSON wrapper (with its
+        # escaped copy of the whole document) on every pipeline run
+        (output_dir / "source_text.txt").write_text(source_text, encoding="utf-8")
+
         # Save extracted entities (pre-confirmation)
         entities_path = output_dir / "extracted_entities.json"
         entities_path.write_text(
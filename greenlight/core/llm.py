@@ -6,19 +6,52 @@ Simple, fast, no fallbacks or routing complexity.
 """
 
 import asyncio
+import json
 import logging
-from typing import Optional
+import os
+import weakref
+from pathlib import Path
+from typing import AsyncIterator, Optional, Union
 
 import httpx
 
 from .config import settings
+from .llm_cache import DiskResponseCache, default_cache
 
 logger = logging.getLogger(__name__)
 
+# Only short, reference-style generations (world bible fields etc.) are
+# worth caching; long creative outputs are not reusable. The bound covers
+# the row-marshaled entity batches (~256-320 tokens) so pipeline re-runs
+# hit the cache instead of re-issuing every entity call.
+CACHE_MAX_TOKENS = 512
+
 # Grok 4.1 Fast - the only model we use
 GROK_MODEL = "grok-4-1-fast"
 GROK_API_URL = "https://api.x.ai/v1/chat/completions"
 
+# Process-wide cap on in-flight requests. A single shared limit (rather
+# than one per LLMClient) keeps concurrently running pipelines from
+# multiplying their fan-outs into provider 429s and retry backoff storms.
+LLM_CONCURRENCY = int(os.getenv("GL_LLM_CONCURRENCY", "32"))
+
+# asyncio primitives bind to the loop they are first awaited on, so the
+# shared semaphore is kept per event loop (weakly, so finished loops and
+# their semaphores are dropped together)
+_loop_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the shared request semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _loop_semaphores.get(loop)
+    if sem is None:
+        sem = asyncio.Semaphore(LLM_CONCURRENCY)
+        _loop_semaphores[loop] = sem
+    return sem
+
 
 class LLMClient:
     """
@@ -29,10 +62,42 @@ class LLMClient:
         response = await client.generate("Write a story about...")
     """
 
-    def __init__(self, max_retries: int = 3):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        use_cache: bool = False,
+        cache_dir: Optional[Path] = None,
+    ):
         self.max_retries = max_retries
+        self.use_cache = use_cache
+        # Optional persistent cache: unlike the in-memory cache it has no
+        # token-size gate — pipelines that opt in (writer re-runs on an
+        # unchanged pitch) want their long generations back too
+        self._disk_cache = DiskResponseCache(cache_dir) if cache_dir else None
+        # One pooled client for the lifetime of this LLMClient — a fresh
+        # AsyncClient per call pays TCP+TLS handshake on every prompt
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         self._validate_api_key()
 
+    def _get_client(self) -> httpx.AsyncClient:
+        # Pooled connections belong to the loop they were opened on; a
+        # long-lived client (e.g. the module singleton below) can outlive
+        # an asyncio.run and must not reuse a dead loop's sockets
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(120.0),
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
     def _validate_api_key(self):
         """Ensure xAI API key is configured."""
         if not settings.xai_api_key:
@@ -44,6 +109,7 @@ class LLMClient:
         system_prompt: str = "",
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        json_mode: bool = False,
     ) -> str:
         """
         Generate text using Grok 4.1 Fast.
@@ -53,6 +119,7 @@ class LLMClient:
             system_prompt: Optional system instructions
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0-1)
+            json_mode: Constrain output to a JSON object (provider JSON mode)
 
         Returns:
             Generated text response
@@ -60,51 +127,142 @@ class LLMClient:
         if not settings.xai_api_key:
             raise ValueError("XAI_API_KEY not configured")
 
+        cache_key = None
+        mem_cacheable = self.use_cache and max_tokens <= CACHE_MAX_TOKENS
+        if mem_cacheable or self._disk_cache is not None:
+            cache_key = default_cache.make_key(
+                ("json:" if json_mode else "") + prompt, system_prompt, max_tokens, temperature
+            )
+        if mem_cacheable:
+            cached = default_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        if self._disk_cache is not None:
+            cached = self._disk_cache.get(cache_key)
+            if cached is not None:
+                if mem_cacheable:
+                    default_cache.put(cache_key, cached)
+                return cached
+
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        for attempt in range(self.max_retries):
-            try:
-                async with httpx.AsyncClient(timeout=120.0) as client:
+        payload = {
+            "model": GROK_MODEL,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if json_mode:
+            payload["response_format"] = {"type": "json_object"}
+
+        # All clients in the process share one loop-wide semaphore, so
+        # concurrent pipelines can't stack their individual limits
+        async with _get_semaphore():
+            for attempt in range(self.max_retries):
+                try:
+                    client = self._get_client()
                     response = await client.post(
                         GROK_API_URL,
                         headers={
                             "Authorization": f"Bearer {settings.xai_api_key}",
                             "Content-Type": "application/json",
                         },
-                        json={
-                            "model": GROK_MODEL,
-                            "messages": messages,
-                            "max_tokens": max_tokens,
-                            "temperature": temperature,
-                        },
+                        json=payload,
                     )
                     response.raise_for_status()
                     data = response.json()
-                    return data["choices"][0]["message"]["content"]
+                    content = data["choices"][0]["message"]["content"]
+                    if mem_cacheable:
+                        default_cache.put(cache_key, content)
+                    if self._disk_cache is not None:
+                        self._disk_cache.put(cache_key, content)
+                    return content
 
-            except httpx.HTTPStatusError as e:
-                logger.warning(f"Grok API error (attempt {attempt + 1}): {e.response.status_code}")
-                if attempt == self.max_retries - 1:
-                    raise
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                except httpx.HTTPStatusError as e:
+                    logger.warning(f"Grok API error (attempt {attempt + 1}): {e.response.status_code}")
+                    if attempt == self.max_retries - 1:
+                        raise
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
 
-            except Exception as e:
-                logger.warning(f"LLM error (attempt {attempt + 1}): {e}")
-                if attempt == self.max_retries - 1:
-                    raise
-                await asyncio.sleep(2 ** attempt)
+                except Exception as e:
+                    logger.warning(f"LLM error (attempt {attempt + 1}): {e}")
+                    if attempt == self.max_retries - 1:
+                        raise
+                    await asyncio.sleep(2 ** attempt)
 
         raise RuntimeError("All LLM attempts failed")
 
+    async def generate_structured(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> dict:
+        """
+        Generate a JSON object response and parse it.
+
+        Used for row-marshaled prompts that pack several fields into one
+        call instead of one call per field.
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            json.JSONDecodeError if the response is not valid JSON
+        """
+        content = await self.generate(
+            prompt, system_prompt, max_tokens, temperature, json_mode=True
+        )
+        # Strip markdown fences if the model added them despite JSON mode
+        text = content.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[1] if "\n" in text else text
+            text = text.rsplit("```", 1)[0]
+        return json.loads(text)
+
+    async def generate_streaming(
+        self,
+        prompts: list[tuple[str, str]],  # List of (prompt, system_prompt) tuples
+        max_tokens: Union[int, list[int]] = 4096,
+        temperature: float = 0.7,
+        structured: bool = False,
+    ) -> AsyncIterator[tuple[int, Union[str, dict, Exception]]]:
+        """
+        Generate multiple responses, yielding (index, result) pairs as each
+        completes rather than waiting for the slowest.
+
+        Lets callers fire progress/UI updates immediately; failures are
+        yielded as the Exception instance (mirroring return_exceptions).
+        max_tokens may be a list (one budget per prompt) so short fields
+        don't reserve oversized output allocations.
+        """
+        async def _run(i: int, prompt: str, system: str):
+            tokens = max_tokens[i] if isinstance(max_tokens, list) else max_tokens
+            try:
+                if structured:
+                    return i, await self.generate_structured(prompt, system, tokens, temperature)
+                return i, await self.generate(prompt, system, tokens, temperature)
+            except Exception as e:
+                return i, e
+
+        tasks = [
+            asyncio.create_task(_run(i, prompt, system))
+            for i, (prompt, system) in enumerate(prompts)
+        ]
+        for future in asyncio.as_completed(tasks):
+            yield await future
+
     async def generate_batch(
         self,
         prompts: list[tuple[str, str]],  # List of (prompt, system_prompt) tuples
         max_tokens: int = 4096,
         temperature: float = 0.7,
-    ) -> list[str]:
+        structured: bool = False,
+    ) -> list:
         """
         Generate multiple responses in parallel.
 
@@ -112,17 +270,36 @@ class LLMClient:
             prompts: List of (prompt, system_prompt) tuples
             max_tokens: Maximum tokens per response
             temperature: Sampling temperature
+            structured: Use generate_structured (JSON object per response)
 
         Returns:
             List of generated responses (same order as prompts)
         """
-        tasks = [
-            self.generate(prompt, system, max_tokens, temperature)
-            for prompt, system in prompts
-        ]
+        if structured:
+            tasks = [
+                self.generate_structured(prompt, system, max_tokens, temperature)
+                for prompt, system in prompts
+            ]
+        else:
+            tasks = [
+                self.generate(prompt, system, max_tokens, temperature)
+                for prompt, system in prompts
+            ]
         return await asyncio.gather(*tasks, return_exceptions=True)
 
 
+# Shared client for the module-level helpers: a fresh LLMClient per call
+# would open (and abandon) a new connection pool every time
+_shared_client: Optional[LLMClient] = None
+
+
+def _get_shared_client() -> LLMClient:
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = LLMClient()
+    return _shared_client
+
+
 # Convenience function for quick generation
 async def generate(
     prompt: str,
@@ -130,8 +307,7 @@ async def generate(
     max_tokens: int = 4096,
 ) -> str:
     """Quick generation helper using Grok 4.1 Fast."""
-    client = LLMClient()
-    return await client.generate(prompt, system_prompt, max_tokens)
+    return await _get_shared_client().generate(prompt, system_prompt, max_tokens)
 
 
 # Convenience function for parallel generation (used by consensus extraction)
@@ -140,5 +316,4 @@ async def generate_parallel(
     max_tokens: int = 4096,
 ) -> list[str]:
     """Generate multiple responses in parallel."""
-    client = LLMClient()
-    return await client.generate_batch(prompts, max_tokens)
+    return await _get_shared_client().generate_batch(prompts, max_tokens)
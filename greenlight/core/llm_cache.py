@@ -0,0 +1,100 @@
+"""
+LLM response cache for Project Greenlight.
+
+World-builder prompts are frequently identical across pipeline re-runs
+(same project, same source text), so repeat calls can be answered from
+a local cache in microseconds instead of a full LLM round-trip.
+
+Lookups are exact-match on a hash of (system_prompt, prompt) — the
+process is long-lived (API server), so re-runs within a session hit
+the cache without any external dependency.
+
+TRACE: LLM-002
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Bounded in-memory cache for LLM responses.
+
+    Keys are a blake2b digest of the full prompt material plus the
+    sampling parameters, so different max_tokens/temperature settings
+    never collide.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(prompt: str, system_prompt: str, max_tokens: int, temperature: float) -> str:
+        material = f"{system_prompt}\x00{prompt}\x00{max_tokens}\x00{temperature}"
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskResponseCache:
+    """
+    Content-addressable on-disk cache for LLM responses.
+
+    Survives process restarts, so full pipeline re-runs on an unchanged
+    pitch skip their LLM calls entirely. One file per entry under the
+    given directory, named by the same blake2b key the in-memory cache
+    uses; writes are atomic (tmp + rename). Opt-in per pipeline via
+    LLMClient(cache_dir=...).
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        path = self.cache_dir / f"{key}.txt"
+        try:
+            value = path.read_text(encoding="utf-8")
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{key}.tmp"
+            tmp_path.write_text(value, encoding="utf-8")
+            tmp_path.replace(self.cache_dir / f"{key}.txt")
+        except OSError as e:
+            logger.warning(f"Could not write LLM cache entry: {e}")
+
+
+# Shared across all LLMClient instances in the process
+default_cache = ResponseCache()
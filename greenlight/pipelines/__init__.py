@@ -1,30 +1,40 @@
-"""Pipeline modules for Project Greenlight."""
-
-from .writer import WriterPipeline
-from .director import DirectorPipeline
-from .references import ReferencesPipeline, generate_references
-from .storyboard import (
-    StoryboardPipeline,
-    generate_storyboard,
-    generate_scene,
-    generate_frame,
-)
-from .outline_generator import OutlineGeneratorPipeline, generate_outlines
-from .world_builder import WorldBuilderPipeline, build_world
-
-__all__ = [
-    # Pipelines
-    "WriterPipeline",
-    "DirectorPipeline",
-    "ReferencesPipeline",
-    "StoryboardPipeline",
-    "OutlineGeneratorPipeline",
-    "WorldBuilderPipeline",
-    # Convenience functions
-    "generate_storyboard",
-    "generate_scene",
-    "generate_frame",
-    "generate_outlines",
-    "generate_references",
-    "build_world",
-]
+"""Pipeline modules for Project Greenlight.
+
+Re-exports are resolved lazily (PEP 562): importing this package — or one
+pipeline from it — no longer pulls in every pipeline module and their
+pydantic/httpx dependency graphs at once, which is a measurable slice of
+CLI and server cold-start.
+"""
+
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "WriterPipeline": "writer",
+    "DirectorPipeline": "director",
+    "ReferencesPipeline": "references",
+    "generate_references": "references",
+    "StoryboardPipeline": "storyboard",
+    "generate_storyboard": "storyboard",
+    "generate_scene": "storyboard",
+    "generate_frame": "storyboard",
+    "OutlineGeneratorPipeline": "outline_generator",
+    "generate_outlines": "outline_generator",
+    "WorldBuilderPipeline": "world_builder",
+    "build_world": "world_builder",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
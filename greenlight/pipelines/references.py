@@ -16,6 +16,7 @@ to clearly identify entities in the generated references.
 TRACE: REFERENCES-001
 """
 
+import functools
 import json
 import logging
 from pathlib import Path
@@ -178,6 +179,7 @@ MEDIA_TYPE_STYLES = {
 DEFAULT_MEDIA_STYLE = MEDIA_TYPE_STYLES["live_action"]
 
 
+@functools.lru_cache(maxsize=None)
 def get_media_style_prompt(visual_style: str) -> str:
     """Get the reinforcing style prompt for a media type."""
     return MEDIA_TYPE_STYLES.get(visual_style, DEFAULT_MEDIA_STYLE)
@@ -237,6 +239,7 @@ Visual Style: {media_style_prompt}
 Clean studio lighting, neutral background, detailed product shot, sharp focus."""
 
 
+@functools.lru_cache(maxsize=None)
 def get_character_prompt_template(visual_style: str) -> str:
     """Get the appropriate character prompt template based on visual style."""
     if visual_style == "live_action":
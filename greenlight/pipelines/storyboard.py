@@ -15,17 +15,59 @@ Supports:
 TRACE: STORYBOARD-001
 """
 
+import asyncio
+import functools
 import json
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Callable, Optional
 
 from greenlight.core.image_gen import ImageGenerator, ImageRequest, ImageModel, get_media_style_prompt
 from greenlight.core.models import PipelineStage
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Built once; _parse_model is called on every pipeline construction
+_MODEL_MAP = {
+    "seedream": ImageModel.SEEDREAM,
+    "flux_2_pro": ImageModel.FLUX_2_PRO,
+    "p_image_edit": ImageModel.P_IMAGE_EDIT,
+    "nano_banana": ImageModel.NANO_BANANA,
+    "nano_banana_pro": ImageModel.NANO_BANANA_PRO,
+    "z_image_turbo": ImageModel.Z_IMAGE_TURBO,
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _style_suffix_for(visual_style: str, style_notes: str) -> str:
+    """Cache the composed style suffix; recomputed per frame otherwise."""
+    parts = [get_media_style_prompt(visual_style)]
+    if style_notes:
+        parts.append(style_notes)
+    return " ".join(parts)
+
+
+def _read_json(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_json(path: Path, data) -> None:
+    """Write indented JSON, using orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
 
 class StoryboardPipeline:
     """
@@ -44,6 +86,7 @@ class StoryboardPipeline:
         image_model: str = "flux_2_pro",
         max_frames: Optional[int] = None,
         scene_filter: Optional[list[int]] = None,  # Generate only specific scenes
+        max_concurrent_scenes: int = 3,
         log_callback: Optional[Callable[[str], None]] = None,
         stage_callback: Optional[Callable[[str, str, Optional[str]], None]] = None,
         progress_callback: Optional[Callable[[float], None]] = None,
@@ -53,6 +96,7 @@ class StoryboardPipeline:
         self.image_model = self._parse_model(image_model)
         self.max_frames = max_frames
         self.scene_filter = scene_filter  # e.g., [1, 2] to generate only scenes 1 and 2
+        self.max_concurrent_scenes = max_concurrent_scenes
 
         self._log = log_callback or (lambda x: logger.info(x))
         self._stage = stage_callback or (lambda *args: None)
@@ -61,17 +105,15 @@ class StoryboardPipeline:
 
         self.generator = ImageGenerator(project_path=project_path)
 
+        # Memoized (frames, index) pair for repeated single-frame lookups
+        self._frame_index_cache: Optional[tuple[list[dict], dict, dict]] = None
+
+        # Loaded frames, keyed by source file mtime so edits invalidate it
+        self._frames_cache: Optional[tuple[Optional[int], list[dict]]] = None
+
     def _parse_model(self, model: str) -> ImageModel:
         """Parse model string to enum."""
-        model_map = {
-            "seedream": ImageModel.SEEDREAM,
-            "flux_2_pro": ImageModel.FLUX_2_PRO,
-            "p_image_edit": ImageModel.P_IMAGE_EDIT,
-            "nano_banana": ImageModel.NANO_BANANA,
-            "nano_banana_pro": ImageModel.NANO_BANANA_PRO,
-            "z_image_turbo": ImageModel.Z_IMAGE_TURBO,
-        }
-        return model_map.get(model.lower(), ImageModel.FLUX_2_PRO)
+        return _MODEL_MAP.get(model.lower(), ImageModel.FLUX_2_PRO)
 
     async def run(self, check_cancelled: Callable[[], bool] = None) -> dict:
         """Execute the storyboard pipeline."""
@@ -114,6 +156,10 @@ class StoryboardPipeline:
             output_dir = self.project_path / "storyboard_output" / "generated"
             output_dir.mkdir(parents=True, exist_ok=True)
 
+            # One directory listing instead of a stat call per frame
+            # (reruns with many frames already generated hit this a lot)
+            existing_outputs = {p.name for p in output_dir.iterdir() if p.suffix == ".png"}
+
             # Prompts log
             prompts_log = []
             prompts_log_path = self.project_path / "storyboard_output" / "prompts_log.json"
@@ -124,105 +170,200 @@ class StoryboardPipeline:
             self._stage("Generate Images", PipelineStage.RUNNING.value)
             self._progress(0.1)
 
-            completed = 0
-            failed = 0
-            skipped = 0
-            prior_frame_path: Optional[Path] = None
-            current_scene: Optional[int] = None
-
+            # Frames within a scene are generated sequentially (the prior
+            # frame feeds the next for continuity), but scenes are independent
+            # of each other, so they run as concurrent workers. Results are
+            # surfaced as soon as any scene makes progress rather than in
+            # submission order.
+            scenes: dict[int, list[tuple[int, dict]]] = {}
             for i, frame in enumerate(frames):
-                # Check for cancellation
-                if check_cancelled and check_cancelled():
-                    self._log(f"Cancelled after {completed} frames")
-                    return {
-                        "success": True,
-                        "cancelled": True,
-                        "completed": completed,
-                        "failed": failed,
-                        "total": total_frames,
-                    }
-
-                frame_id = frame.get("frame_id", f"frame_{i+1}")
-                prompt = frame.get("prompt", "")
-                scene_num = frame.get("scene_number", 1)
-                tags = frame.get("tags", {})
-
-                # Reset prior frame on scene change
-                if scene_num != current_scene:
-                    prior_frame_path = None
-                    current_scene = scene_num
+                scenes.setdefault(frame.get("scene_number", 1), []).append((i, frame))
+
+            counters = {"completed": 0, "failed": 0, "skipped": 0, "done": 0}
+            cancelled = False
+
+            # One datetime construction per run; per-frame timestamps are
+            # derived from a cheap time_ns delta against this base
+            run_start_dt = datetime.now()
+            run_start_ns = time.time_ns()
+
+            def _timestamp() -> str:
+                delta_us = (time.time_ns() - run_start_ns) // 1000
+                return (run_start_dt + timedelta(microseconds=delta_us)).isoformat()
+            scene_sem = asyncio.Semaphore(self.max_concurrent_scenes)
+
+            # (scene_number, position-in-scene, entry) so the log can be
+            # written in deterministic order regardless of completion order
+            log_entries: list[tuple[int, int, dict]] = []
+
+            def _frame_done():
+                counters["done"] += 1
+                self._progress(0.1 + counters["done"] / total_frames * 0.85)
+
+            # Dedicated writer task: workers enqueue entries (instant) and the
+            # writer persists snapshots off the event loop, coalescing bursts
+            # so generation never waits on disk.
+            log_queue: asyncio.Queue = asyncio.Queue()
+
+            async def _log_writer():
+                while True:
+                    item = await log_queue.get()
+                    shutdown = item is None
+                    if not shutdown:
+                        log_entries.append(item)
+                    # Drain anything queued while the last write was in flight
+                    while not log_queue.empty():
+                        nxt = log_queue.get_nowait()
+                        if nxt is None:
+                            shutdown = True
+                        else:
+                            log_entries.append(nxt)
+                    prompts_log[:] = [e for _, _, e in sorted(log_entries, key=lambda t: t[:2])]
+                    await asyncio.to_thread(_write_json, prompts_log_path, list(prompts_log))
+                    if shutdown:
+                        return
+
+            async def _run_scene(scene_num: int, scene_frames: list[tuple[int, dict]]):
+                nonlocal cancelled
+                async with scene_sem:
+                    prior_frame_path: Optional[Path] = None
                     self._log(f"Scene {scene_num}")
 
-                if not prompt:
-                    self._log(f"  {frame_id} - skipped (no prompt)")
-                    skipped += 1
-                    continue
-
-                # Check if already exists
-                clean_frame_id = frame_id.replace("[", "").replace("]", "")
-                output_path = output_dir / f"{clean_frame_id}.png"
-
-                if output_path.exists():
-                    self._log(f"  {frame_id} - exists, skipping")
-                    prior_frame_path = output_path  # Use as prior for next frame
-                    skipped += 1
-                    continue
-
-                # Update item progress
-                self._item(i, total_frames, f"Generating {frame_id}")
-
-                # Collect reference images IN ORDER:
-                # 1. Location first (establishing)
-                # 2. Characters (in tag order)
-                # 3. Props
-                # 4. Prior frame (continuity)
-                reference_images = self._collect_references(
-                    tags=tags,
-                    refs_dir=refs_dir,
-                    prior_frame=prior_frame_path,
-                )
-
-                # Build full prompt
-                full_prompt = f"{prompt} {style_suffix}"
-
-                ref_count = len(reference_images)
-                self._log(f"  {frame_id} - {ref_count} refs")
-
-                # Generate image
-                result = await self.generator.generate(ImageRequest(
-                    prompt=full_prompt,
-                    model=self.image_model,
-                    output_path=output_path,
-                    reference_images=reference_images[:8],  # Limit to 8
-                    aspect_ratio="16:9",
-                    prefix_type="generate",
-                ))
-
-                # Log the generation
-                prompts_log.append({
-                    "frame_id": clean_frame_id,
-                    "scene_number": scene_num,
-                    "prompt": full_prompt,
-                    "reference_images": [str(p) for p in reference_images],
-                    "output_path": str(output_path),
-                    "success": result.success,
-                    "error": result.error,
-                    "timestamp": datetime.now().isoformat(),
-                })
-
-                if result.success:
-                    completed += 1
-                    prior_frame_path = output_path
-                    self._log(f"  {frame_id} - saved")
-                else:
-                    failed += 1
-                    self._log(f"  {frame_id} - failed: {result.error}")
-
-                # Update progress
-                self._progress(0.1 + (i + 1) / total_frames * 0.85)
-
-                # Save prompts log incrementally
-                prompts_log_path.write_text(json.dumps(prompts_log, indent=2), encoding="utf-8")
+                    # One-slot prefetch: collect the next frame's references
+                    # (file existence checks) while the current generate call
+                    # is in flight. The prior frame is appended at use time
+                    # since it isn't known until the previous frame finishes.
+                    next_refs_task: Optional[asyncio.Task] = asyncio.create_task(
+                        asyncio.to_thread(
+                            self._collect_references,
+                            scene_frames[0][1].get("tags", {}),
+                            refs_dir,
+                            None,
+                        )
+                    )
+
+                    for pos, (i, frame) in enumerate(scene_frames):
+                        if cancelled or (check_cancelled and check_cancelled()):
+                            cancelled = True
+                            if next_refs_task:
+                                next_refs_task.cancel()
+                            return
+
+                        frame_id = frame.get("frame_id", f"frame_{i+1}")
+                        prompt = frame.get("prompt", "")
+
+                        # Consume this frame's prefetched references and
+                        # immediately schedule the next frame's so prep
+                        # overlaps generation.
+                        base_references = await next_refs_task if next_refs_task else []
+                        next_refs_task = None
+                        if pos + 1 < len(scene_frames):
+                            next_refs_task = asyncio.create_task(
+                                asyncio.to_thread(
+                                    self._collect_references,
+                                    scene_frames[pos + 1][1].get("tags", {}),
+                                    refs_dir,
+                                    None,
+                                )
+                            )
+
+                        if not prompt:
+                            self._log(f"  {frame_id} - skipped (no prompt)")
+                            counters["skipped"] += 1
+                            _frame_done()
+                            continue
+
+                        # Check if already exists
+                        clean_frame_id = frame_id.replace("[", "").replace("]", "")
+                        output_path = output_dir / f"{clean_frame_id}.png"
+
+                        if output_path.name in existing_outputs:
+                            self._log(f"  {frame_id} - exists, skipping")
+                            prior_frame_path = output_path  # Use as prior for next frame
+                            counters["skipped"] += 1
+                            _frame_done()
+                            continue
+
+                        # Update item progress
+                        self._item(i, total_frames, f"Generating {frame_id}")
+
+                        # Reference images IN ORDER (location, characters,
+                        # props were prefetched); append the prior frame for
+                        # scene continuity.
+                        reference_images = list(base_references)
+                        if prior_frame_path and prior_frame_path.exists():
+                            reference_images.append(prior_frame_path)
+
+                        # Build full prompt
+                        full_prompt = f"{prompt} {style_suffix}"
+
+                        ref_count = len(reference_images)
+                        self._log(f"  {frame_id} - {ref_count} refs")
+
+                        # Generate image
+                        result = await self.generator.generate(ImageRequest(
+                            prompt=full_prompt,
+                            model=self.image_model,
+                            output_path=output_path,
+                            reference_images=reference_images[:8],  # Limit to 8
+                            aspect_ratio="16:9",
+                            prefix_type="generate",
+                        ))
+
+                        # Log the generation
+                        log_queue.put_nowait((scene_num, pos, {
+                            "frame_id": clean_frame_id,
+                            "scene_number": scene_num,
+                            "prompt": full_prompt,
+                            "reference_images": [str(p) for p in reference_images],
+                            "output_path": str(output_path),
+                            "success": result.success,
+                            "error": result.error,
+                            "timestamp": _timestamp(),
+                        }))
+
+                        if result.success:
+                            counters["completed"] += 1
+                            prior_frame_path = output_path
+                            self._log(f"  {frame_id} - saved")
+                        else:
+                            counters["failed"] += 1
+                            self._log(f"  {frame_id} - failed: {result.error}")
+
+                        _frame_done()
+
+            writer_task = asyncio.create_task(_log_writer())
+            try:
+                pending = {
+                    asyncio.create_task(_run_scene(scene_num, scene_frames))
+                    for scene_num, scene_frames in scenes.items()
+                }
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        try:
+                            task.result()
+                        except Exception:
+                            for p in pending:
+                                p.cancel()
+                            raise
+            finally:
+                log_queue.put_nowait(None)  # Sentinel: flush and stop
+                await writer_task
+
+            completed = counters["completed"]
+            failed = counters["failed"]
+            skipped = counters["skipped"]
+
+            if cancelled:
+                self._log(f"Cancelled after {completed} frames")
+                return {
+                    "success": True,
+                    "cancelled": True,
+                    "completed": completed,
+                    "failed": failed,
+                    "total": total_frames,
+                }
 
             self._stage("Generate Images", PipelineStage.COMPLETE.value)
 
@@ -230,7 +371,7 @@ class StoryboardPipeline:
             self._stage("Save Outputs", PipelineStage.RUNNING.value)
             self._progress(0.98)
 
-            prompts_log_path.write_text(json.dumps(prompts_log, indent=2), encoding="utf-8")
+            # Writer task already flushed the final snapshot on shutdown
             self._log(f"Saved prompts_log.json")
 
             self._stage("Save Outputs", PipelineStage.COMPLETE.value)
@@ -299,7 +440,7 @@ class StoryboardPipeline:
         # Try prompts.json first (user-edited)
         prompts_path = self.project_path / "storyboard" / "prompts.json"
         if prompts_path.exists():
-            prompts_data = json.loads(prompts_path.read_text(encoding="utf-8"))
+            prompts_data = _read_json(prompts_path)
             return [
                 {
                     "frame_id": p.get("frame_id", ""),
@@ -314,7 +455,7 @@ class StoryboardPipeline:
         # Fall back to visual_script.json
         vs_path = self.project_path / "storyboard" / "visual_script.json"
         if vs_path.exists():
-            vs_data = json.loads(vs_path.read_text(encoding="utf-8"))
+            vs_data = _read_json(vs_path)
             frames = []
             for frame in vs_data.get("frames", []):
                 frames.append({
@@ -332,32 +473,65 @@ class StoryboardPipeline:
         """Load world config for style information."""
         wc_path = self.project_path / "world_bible" / "world_config.json"
         if wc_path.exists():
-            return json.loads(wc_path.read_text(encoding="utf-8"))
+            return _read_json(wc_path)
         return {}
 
     def _build_style_suffix(self, world_config: dict) -> str:
         """Build style suffix from world config using media type templates."""
-        parts = []
+        return _style_suffix_for(
+            world_config.get("visual_style", "live_action"),
+            world_config.get("style_notes", ""),
+        )
 
-        visual_style = world_config.get("visual_style", "live_action")
-        # Use the centralized media style prompt
-        media_style = get_media_style_prompt(visual_style)
-        parts.append(media_style)
+    def _build_frame_index(self, frames: list[dict]) -> tuple[dict, dict]:
+        """
+        Build (and memoize) lookup structures for single-frame generation:
+        frame_id -> position within its scene, and scene_number -> frames.
+        """
+        if self._frame_index_cache and self._frame_index_cache[0] is frames:
+            return self._frame_index_cache[1], self._frame_index_cache[2]
 
-        style_notes = world_config.get("style_notes", "")
-        if style_notes:
-            parts.append(style_notes)
+        pos_in_scene: dict[str, int] = {}
+        frames_by_scene: dict[int, list[dict]] = {}
+        for f in frames:
+            bucket = frames_by_scene.setdefault(f.get("scene_number", 1), [])
+            pos_in_scene[f.get("frame_id", "")] = len(bucket)
+            bucket.append(f)
 
-        return " ".join(parts)
+        self._frame_index_cache = (frames, pos_in_scene, frames_by_scene)
+        return pos_in_scene, frames_by_scene
 
-    async def generate_single_frame(self, frame_id: str, force: bool = False) -> dict:
+    def _load_frames_cached(self) -> list[dict]:
+        """Load frames once and reuse across calls; invalidated by source mtime."""
+        prompts_path = self.project_path / "storyboard" / "prompts.json"
+        vs_path = self.project_path / "storyboard" / "visual_script.json"
+        source = prompts_path if prompts_path.exists() else vs_path
+        mtime = source.stat().st_mtime_ns if source.exists() else None
+
+        if self._frames_cache and self._frames_cache[0] == mtime:
+            return self._frames_cache[1]
+
+        frames = self._load_frames()
+        self._frames_cache = (mtime, frames)
+        return frames
+
+    async def generate_single_frame(
+        self,
+        frame_id: str,
+        force: bool = False,
+        *,
+        frames: Optional[list[dict]] = None,
+    ) -> dict:
         """
         Generate a single frame by ID.
 
         Useful for regenerating specific frames after prompt edits.
         Archives the existing frame before regeneration when force=True.
+        Callers doing batch regeneration can pass a preloaded frames list
+        to skip the per-call JSON parse.
         """
-        frames = self._load_frames()
+        if frames is None:
+            frames = self._load_frames_cached()
         frame = next((f for f in frames if f.get("frame_id") == frame_id), None)
 
         if not frame:
@@ -393,10 +567,11 @@ class StoryboardPipeline:
         world_config = self._load_world_config()
         style_suffix = self._build_style_suffix(world_config)
 
-        # Find prior frame in same scene for continuity
+        # Find prior frame in same scene for continuity (O(1) via index)
         scene_num = frame.get("scene_number", 1)
-        scene_frames = [f for f in frames if f.get("scene_number") == scene_num]
-        frame_idx = next((i for i, f in enumerate(scene_frames) if f.get("frame_id") == frame_id), 0)
+        pos_in_scene, frames_by_scene = self._build_frame_index(frames)
+        scene_frames = frames_by_scene.get(scene_num, [])
+        frame_idx = pos_in_scene.get(frame_id, 0)
 
         prior_frame = None
         if frame_idx > 0:
@@ -454,7 +629,12 @@ async def generate_scene(project_path: Path, scene_number: int) -> dict:
     return await generate_storyboard(project_path, scene_filter=[scene_number])
 
 
-async def generate_frame(project_path: Path, frame_id: str, force: bool = False) -> dict:
+async def generate_frame(
+    project_path: Path,
+    frame_id: str,
+    force: bool = False,
+    frames: Optional[list[dict]] = None,
+) -> dict:
     """Generate a single frame."""
     pipeline = StoryboardPipeline(project_path)
-    return await pipeline.generate_single_frame(frame_id, force=force)
+    return await pipeline.generate_single_frame(frame_id, force=force, frames=frames)
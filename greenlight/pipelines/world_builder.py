@@ -15,13 +15,17 @@ TRACE: INGEST-003
 """
 
 import asyncio
+import hashlib
+import itertools
 import json
 import logging
+import re
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Callable, Optional
 
-from greenlight.core.llm import LLMClient, generate_parallel
+from greenlight.core.llm import LLMClient
 from greenlight.core.models import (
     Character,
     Location,
@@ -32,8 +36,35 @@ from greenlight.core.models import (
     PipelineStage,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Lazy line iteration for title extraction — avoids splitting the whole
+# script into a list just to look at the first few lines
+_LINE_RE = re.compile(r"^[^\n]*", re.MULTILINE)
+
+
+def _read_json(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _truncate_words(value: str, max_words: int, keep: int) -> str:
+    """Truncate to `keep` words when `value` exceeds `max_words`.
+
+    split(maxsplit=...) stops scanning after the limit, so long outputs
+    never get fully tokenized just to count them.
+    """
+    if len(value.split(maxsplit=max_words)) <= max_words:
+        return value
+    return " ".join(value.split(maxsplit=keep)[:keep]) + "..."
+
 
 # =============================================================================
 # SYSTEM PROMPTS - World Bible Generation
@@ -144,6 +175,29 @@ Output ONLY the mood description, 20-44 words.""",
 }
 
 
+# Row-marshaled variant: all world context fields in ONE JSON call instead
+# of one call per field (same guidance as WORLD_CONTEXT_PROMPTS, condensed).
+# The key list is derived from WORLD_CONTEXT_PROMPTS so the requested JSON
+# keys can never drift from the fields the parser reads back.
+WORLD_CONTEXT_BATCH_PROMPT = f"""You are a world-building expert for cinematic pre-production.
+Generate a JSON object with exactly these keys:
+{", ".join(WORLD_CONTEXT_PROMPTS)}
+
+Each value is a single 20-44 word description:
+- setting: geographic location, specific region/country, environment type, climate, general atmosphere
+- time_period: specific era, year/century/decade, historical events shaping the period, technological and social context
+- cultural_context: dominant culture/ethnicity, social norms, belief systems, customs, values
+- social_structure: class system, power dynamics, who holds authority, how status is displayed
+- technology_level: what technology exists, materials, transportation, lighting, tools
+- clothing_norms: silhouettes, typical garments by gender, fabrics, color significance, class distinctions
+- architecture_style: building types, materials, structural features, decorative elements
+- color_palette: primary and accent colors, colors by setting, color meanings in this culture
+- lighting_style: primary light sources, time of day preferences, mood lighting, interior vs exterior
+- mood: emotional tone, underlying tensions, visual atmosphere, sensory qualities
+
+Be specific and evocative. Output ONLY the JSON object."""
+
+
 CHARACTER_FIELD_PROMPTS = {
     "appearance": """You are a character designer for cinematic pre-production.
 Describe this character's PHYSICAL APPEARANCE in 30-50 words.
@@ -195,6 +249,18 @@ Output ONLY the character summary, 20-35 words.""",
 }
 
 
+# Row-marshaled variant: all four character fields in ONE JSON call
+CHARACTER_BATCH_PROMPT = """You are a character designer for cinematic pre-production.
+Generate a JSON object with exactly these keys: appearance, clothing, personality, summary
+
+- appearance (30-50 words): ethnicity/race matching the cultural context, age, gender, body type/build, facial features, skin tone, hair, 1-2 distinguishing physical traits — in that order
+- clothing (20-35 words): default costume — garment types, fabrics, colors, accessories, how clothing reflects status; MUST match the world's clothing norms and time period
+- personality (15-30 words): core behavioral traits, emotional tendencies, how they carry themselves, interaction style
+- summary (20-35 words): role in the story, defining trait, central motivation, key relationship
+
+Output ONLY the JSON object."""
+
+
 LOCATION_FIELD_PROMPTS = {
     "description": """You are a production designer for cinematic pre-production.
 Describe this LOCATION in 15-24 words.
@@ -235,6 +301,19 @@ Output ONLY the west view description, 10-20 words.""",
 }
 
 
+# Row-marshaled variant: description plus all four views in ONE JSON call
+LOCATION_BATCH_PROMPT = """You are a production designer and cinematographer for cinematic pre-production.
+Generate a JSON object with exactly these keys: description, view_north, view_east, view_south, view_west
+
+- description (15-24 words): physical space, atmosphere, key visual elements; architecture MUST match the world context style
+- view_north (10-20 words): what a camera sees looking NORTH — key visual elements, depth, lighting from this angle
+- view_east (10-20 words): same, looking EAST
+- view_south (10-20 words): same, looking SOUTH
+- view_west (10-20 words): same, looking WEST
+
+Output ONLY the JSON object."""
+
+
 PROP_FIELD_PROMPTS = {
     "description": """You are a prop master for cinematic pre-production.
 Describe this PROP in 10-24 words.
@@ -253,6 +332,21 @@ Output ONLY the significance description, 10-20 words.""",
 }
 
 
+# Field orderings, frozen once — list(dict.keys()) allocates on every call
+# and a tuple can double as a cache key
+WORLD_CONTEXT_FIELDS = tuple(WORLD_CONTEXT_PROMPTS)
+CHARACTER_FIELDS = tuple(CHARACTER_FIELD_PROMPTS)
+LOCATION_FIELDS = tuple(LOCATION_FIELD_PROMPTS)
+
+# Output budgets sized to each field's word target (~1.5 tokens per word
+# plus slack). Over-allocated max_tokens inflates per-request latency and
+# provider-side KV pressure for output that's truncated anyway.
+PROP_MAX_TOKENS = 48                # 10-24 words
+CHARACTER_BATCH_MAX_TOKENS = 320    # four fields totalling ~150 words as JSON
+LOCATION_BATCH_MAX_TOKENS = 256     # five fields totalling ~100 words as JSON
+WORLD_CONTEXT_BATCH_MAX_TOKENS = 768  # ten 20-44 word fields as JSON
+
+
 # =============================================================================
 # WORLD BUILDER PIPELINE
 # =============================================================================
@@ -296,7 +390,21 @@ class WorldBuilderPipeline:
         self._field_update = field_callback or (lambda *args: None)
         self._total_fields = total_fields_callback or (lambda *args: None)
 
-        self.llm = LLMClient()
+        # Cached client: world bible fields are short and deterministic in
+        # their inputs, so re-runs hit the in-process response cache
+        self.llm = LLMClient(use_cache=True)
+
+        # Paragraph split (and lowercased copy) of the source text, computed
+        # once per text and shared by every per-entity context extraction
+        self._paragraph_cache: Optional[tuple[int, list[str], list[str]]] = None
+
+        # entity name (lowercased) -> paragraph indices that mention it,
+        # built by one multi-pattern scan in run(); None until built
+        self._mention_index: Optional[dict[str, list[int]]] = None
+
+        # Entity-level progress shared by the concurrently running phases
+        self._entities_total = 0
+        self._entities_done = 0
 
     async def run(self) -> dict:
         """Execute the world builder pipeline."""
@@ -309,16 +417,30 @@ class WorldBuilderPipeline:
             if not confirmed_path.exists():
                 return {"success": False, "error": "No confirmed entities found"}
 
-            confirmed_data = json.loads(confirmed_path.read_text(encoding="utf-8"))
+            # Load full source text for context - world builder needs the
+            # complete story. Prefer the plain-text copy (no JSON parse of a
+            # potentially multi-MB escaped document); fall back to the JSON
+            # wrapper for projects ingested before the .txt was added.
+            source_txt_path = self.project_path / "ingestion" / "source_text.txt"
+            source_json_path = self.project_path / "ingestion" / "source_text.json"
+
+            def _load_source_text() -> str:
+                if source_txt_path.exists():
+                    return source_txt_path.read_text(encoding="utf-8")
+                if source_json_path.exists():
+                    return _read_json(source_json_path).get("text", "")
+                return ""
+
+            # Both loads off-thread and concurrent — neither depends on the
+            # other and neither should stall the event loop
+            confirmed_data, source_text = await asyncio.gather(
+                asyncio.to_thread(_read_json, confirmed_path),
+                asyncio.to_thread(_load_source_text),
+            )
             entities = confirmed_data.get("entities", {})
             world_hints = confirmed_data.get("world_hints", {})
 
-            # Load full source text for context - world builder needs the complete story
-            source_text_path = self.project_path / "ingestion" / "source_text.json"
-            source_text = ""
-            if source_text_path.exists():
-                source_data = json.loads(source_text_path.read_text(encoding="utf-8"))
-                source_text = source_data.get("text", "")
+            if source_text:
                 self._log(f"Loaded full source text ({len(source_text):,} chars) for context")
 
             char_count = len(entities.get('characters', []))
@@ -330,50 +452,63 @@ class WorldBuilderPipeline:
             # Report total fields to populate for accurate progress tracking
             self._total_fields(char_count, loc_count, prop_count)
 
+            # One multi-pattern pass over the source maps every entity to
+            # its mentioning paragraphs before the phases fan out
+            await asyncio.to_thread(self._build_mention_index, entities, source_text)
+
             self._progress(0.05)
 
-            # Phase 1: Generate World Context (parallel)
+            # Phase 1: Generate World Context (parallel). Slice the excerpt
+            # once here rather than re-slicing the full string downstream.
             self._log("Generating world context...")
-            world_context = await self._generate_world_context(source_text, world_hints)
+            source_excerpt = source_text[:8000]
+            world_context = await self._generate_world_context(source_excerpt, world_hints)
             self._progress(0.25)
 
-            # Phase 2: Generate Character Fields (parallel per character)
-            self._log("Generating character descriptions...")
-            characters = await self._generate_characters(
-                entities.get("characters", []),
-                world_context,
-                source_text,
-            )
-            self._progress(0.50)
-
-            # Phase 3: Generate Location Fields (parallel per location)
-            self._log("Generating location descriptions...")
-            locations = await self._generate_locations(
-                entities.get("locations", []),
-                world_context,
-                source_text,
-            )
-            self._progress(0.75)
-
-            # Phase 4: Generate Prop Fields
-            self._log("Generating prop descriptions...")
-            props = await self._generate_props(
-                entities.get("props", []),
-                world_context,
-                source_text,
+            # Phases 2-4 all depend only on the world context, not on each
+            # other, so the whole IO-bound batch runs as one gather instead
+            # of three sequential awaits. Each phase reports per-entity
+            # progress through _entity_done as its calls resolve.
+            self._entities_total = char_count + loc_count + prop_count
+            self._entities_done = 0
+            self._log("Generating character, location and prop descriptions...")
+            characters, locations, props = await asyncio.gather(
+                self._generate_characters(
+                    entities.get("characters", []),
+                    world_context,
+                    source_text,
+                ),
+                self._generate_locations(
+                    entities.get("locations", []),
+                    world_context,
+                    source_text,
+                ),
+                self._generate_props(
+                    entities.get("props", []),
+                    world_context,
+                    source_text,
+                ),
             )
             self._progress(0.90)
 
+            # Phases are done with the source — drop the cached paragraph
+            # split and mention index so multi-MB intermediates don't
+            # outlive the run in a long-lived server process
+            self._paragraph_cache = None
+            self._mention_index = None
+
             # Build and save world config
             self._log("Saving world config...")
 
-            all_tags = (
-                [c.tag for c in characters] +
-                [l.tag for l in locations] +
-                [p.tag for p in props]
-            )
+            # Single pass, no intermediate per-type lists
+            all_tags = list(map(
+                attrgetter("tag"), itertools.chain(characters, locations, props)
+            ))
 
-            world_config = WorldConfig(
+            # Every field below is internally produced (trimmed LLM output,
+            # already-typed models), so skip pydantic validation of the
+            # nested entity tree on the way out
+            world_config = WorldConfig.model_construct(
                 title=self._extract_title(source_text),
                 genre="Drama",  # Could be extracted from world hints
                 visual_style=self.visual_style,
@@ -392,11 +527,18 @@ class WorldBuilderPipeline:
             world_bible_dir = self.project_path / "world_bible"
             world_bible_dir.mkdir(parents=True, exist_ok=True)
 
+            # model_dump_json serializes in one pydantic-core pass, skipping
+            # the intermediate Python dict a model_dump + dumps pair builds.
+            # Write to a temp file and rename so a crash mid-save never
+            # leaves a truncated world_config.json behind.
             config_path = world_bible_dir / "world_config.json"
-            config_path.write_text(
-                json.dumps(world_config.model_dump(), indent=2),
-                encoding="utf-8"
-            )
+
+            def _save_config() -> None:
+                tmp_path = config_path.with_suffix(".json.tmp")
+                tmp_path.write_bytes(world_config.model_dump_json(indent=2).encode("utf-8"))
+                tmp_path.replace(config_path)
+
+            await asyncio.to_thread(_save_config)
 
             self._progress(1.0)
             self._log("World bible complete!")
@@ -413,12 +555,16 @@ class WorldBuilderPipeline:
             logger.exception(f"World builder error: {e}")
             return {"success": False, "error": str(e)}
 
+        finally:
+            # Release pooled HTTP connections (lazily recreated if reused)
+            await self.llm.aclose()
+
     async def _generate_world_context(
         self,
-        source_text: str,
+        source_excerpt: str,
         world_hints: dict,
     ) -> WorldContext:
-        """Generate all world context fields in parallel."""
+        """Generate all world context fields from the capped source excerpt."""
         # Build context string from hints
         hints_str = ""
         if world_hints:
@@ -429,47 +575,65 @@ class WorldBuilderPipeline:
             if world_hints.get("visual_styles"):
                 hints_str += f"Visual style hints: {', '.join(world_hints['visual_styles'])}\n"
 
-        # Build prompts for all world context fields
-        prompts = []
-        field_names = list(WORLD_CONTEXT_PROMPTS.keys())
+        field_names = WORLD_CONTEXT_FIELDS
 
-        # Use more source text for world context (up to 8000 chars)
-        context_limit = min(len(source_text), 8000)
+        shared_context = f"""SOURCE MATERIAL:
+{source_excerpt}
 
-        for field_name in field_names:
-            system_prompt = WORLD_CONTEXT_PROMPTS[field_name]
-            user_prompt = f"""SOURCE MATERIAL:
-{source_text[:context_limit]}
-
-{hints_str}
+{hints_str}"""
 
-Generate the {field_name.replace('_', ' ')} for this story world."""
-
-            prompts.append((user_prompt, system_prompt))
+        # World context is deterministic in (source excerpt, hints): re-runs
+        # on an unchanged project load the previous result from disk instead
+        # of re-issuing the LLM call.
+        cache_key = hashlib.blake2b(shared_context.encode("utf-8"), digest_size=16).hexdigest()
+        cache_path = self.project_path / ".cache" / "world_context" / f"{cache_key}.json"
+        if cache_path.exists():
+            try:
+                # The cache entry is our own serialized WorldContext —
+                # trusted, so skip pydantic validation on the way back in
+                cached = WorldContext.model_construct(**_read_json(cache_path))
+                self._log("  World context loaded from cache")
+                for field_name in field_names:
+                    value = getattr(cached, field_name, "")
+                    if value:
+                        self._field_update(f"world.{field_name}", value, "complete")
+                return cached
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable world context cache: {e}")
 
-        # Generate all in parallel
-        self._log(f"  Generating {len(field_names)} world context fields in parallel...")
-        results = await generate_parallel(prompts, max_tokens=150)
+        # One row-marshaled JSON call for all fields: the 2-3 KB source
+        # prefix is sent once instead of ten times, and the per-call latency
+        # floor is paid once.
+        self._log(f"  Generating {len(field_names)} world context fields in one batched call...")
+        try:
+            raw_fields = await self.llm.generate_structured(
+                WORLD_CONTEXT_BATCH_PROMPT, shared_context,
+                max_tokens=WORLD_CONTEXT_BATCH_MAX_TOKENS,
+            )
+        except Exception as e:
+            self._log(f"  [WARN] world context generation failed: {e}")
+            raw_fields = {}
 
-        # Build WorldContext from results
+        # Clean and truncate each field, firing UI updates as before
         field_values = {}
-        for i, (field_name, result) in enumerate(zip(field_names, results)):
-            if isinstance(result, Exception):
-                self._log(f"  [WARN] {field_name} failed: {result}")
+        for field_name in field_names:
+            value = raw_fields.get(field_name, "")
+            if not isinstance(value, str):
+                value = str(value)
+            value = value.strip()
+            if not value:
+                self._log(f"  [WARN] {field_name} missing from response")
                 field_values[field_name] = ""
-            else:
-                # Clean the result (remove any extra text)
-                value = result.strip()
-                # Truncate if too long (more than ~50 words)
-                words = value.split()
-                if len(words) > 50:
-                    value = " ".join(words[:44]) + "..."
+                continue
 
-                field_values[field_name] = value
-                self._field_update(f"world.{field_name}", value, "complete")
-                self._log(f"  [OK] {field_name}: {value[:60]}...")
+            # Truncate if too long (more than ~50 words)
+            value = _truncate_words(value, 50, 44)
 
-        return WorldContext(
+            field_values[field_name] = value
+            self._field_update(f"world.{field_name}", value, "complete")
+            self._log(f"  [OK] {field_name}: {value[:60]}...")
+
+        world_context = WorldContext(
             time_period=field_values.get("time_period", ""),
             technology_level=field_values.get("technology_level", ""),
             cultural_context=field_values.get("cultural_context", ""),
@@ -482,6 +646,21 @@ Generate the {field_name.replace('_', ' ')} for this story world."""
             setting_rules=[],  # Could be generated separately if needed
         )
 
+        # Atomic cache write (tmp + rename) so a crash never leaves a
+        # half-written entry. Skip it entirely when every field came back
+        # empty (e.g. the LLM call raised) — caching that result would
+        # make a transient failure permanent via the cache-hit path above.
+        if any(field_values.values()):
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_bytes(world_context.model_dump_json(indent=2).encode("utf-8"))
+                tmp_path.replace(cache_path)
+            except OSError as e:
+                logger.warning(f"Could not write world context cache: {e}")
+
+        return world_context
+
     async def _generate_characters(
         self,
         char_entities: list[dict],
@@ -492,61 +671,91 @@ Generate the {field_name.replace('_', ' ')} for this story world."""
         if not char_entities:
             return []
 
-        characters = []
-
-        for char_data in char_entities:
-            char_name = char_data.get("name", "Unknown")
-            char_tag = char_data.get("tag", f"CHAR_{char_name.upper().replace(' ', '_')}")
-
-            self._log(f"  Generating {char_name}...")
-
-            # Build prompts for all character fields
-            prompts = []
-            field_names = list(CHARACTER_FIELD_PROMPTS.keys())
+        field_names = CHARACTER_FIELDS
 
-            world_context_str = f"""WORLD CONTEXT:
+        world_context_str = f"""WORLD CONTEXT:
 Time Period: {world_context.time_period}
 Cultural Context: {world_context.cultural_context}
 Clothing Norms: {world_context.clothing_norms}
 Social Structure: {world_context.social_structure}"""
 
+        # One row-marshaled JSON call per character (all four fields),
+        # batched across characters under the client's bounded concurrency.
+        prompts = []
+        char_tags = []
+        for char_data in char_entities:
+            char_name = char_data.get("name", "Unknown")
+            # `or` short-circuits: dict.get's default is built even on hits
+            char_tag = char_data.get("tag") or f"CHAR_{char_name.upper().replace(' ', '_')}"
+            char_tags.append((char_name, char_tag))
+
+            self._log(f"  Generating {char_name}...")
+
             # Extract character-specific context from full story
             char_context = self._extract_character_context(char_name, source_text)
 
-            for field_name in field_names:
-                system_prompt = CHARACTER_FIELD_PROMPTS[field_name]
-                user_prompt = f"""CHARACTER: {char_name}
+            # The world context block leads so the prefix shared across ALL
+            # characters caches provider-side, not just within one entity;
+            # the character-specific block and instruction follow.
+            shared_context = f"""{world_context_str}
+
+CHARACTER: {char_name}
 TAG: {char_tag}
 ROLE: {char_data.get('role_hint', 'supporting')}
 
-{world_context_str}
-
 CHARACTER CONTEXT FROM STORY:
-{char_context}
-
-Generate the {field_name} for this character."""
+{char_context}"""
 
-                prompts.append((user_prompt, system_prompt))
+            prompts.append((CHARACTER_BATCH_PROMPT, shared_context))
 
-            # Generate all fields in parallel
-            results = await generate_parallel(prompts, max_tokens=150)
+        # Show spinners for every field before launching
+        for _, char_tag in char_tags:
+            for field_name in field_names:
+                self._field_update(f"character.{char_tag}.{field_name}", "", "pending")
+
+        # Stream results: each character's fields fire the moment its call
+        # resolves instead of after the slowest character in the batch
+        values_by_idx: dict[int, dict] = {}
+        async for idx, result in self.llm.generate_streaming(
+            prompts, max_tokens=CHARACTER_BATCH_MAX_TOKENS, structured=True
+        ):
+            char_name, char_tag = char_tags[idx]
+            if isinstance(result, Exception):
+                self._log(f"  [WARN] {char_name} failed: {result}")
+                # Resolve the spinners so the UI doesn't sit pending forever
+                for field_name in field_names:
+                    self._field_update(f"character.{char_tag}.{field_name}", "", "failed")
+                values_by_idx[idx] = {}
+                self._entity_done()
+                continue
+            raw_fields = result
 
-            # Build Character from results
             field_values = {}
-            for field_name, result in zip(field_names, results):
-                if isinstance(result, Exception):
+            for field_name in field_names:
+                value = raw_fields.get(field_name, "")
+                if not isinstance(value, str):
+                    value = str(value)
+                value = value.strip()
+                if not value:
                     field_values[field_name] = ""
-                else:
-                    value = result.strip()
-                    words = value.split()
-                    # Allow longer descriptions for appearance (50 words) and clothing (35 words)
-                    max_words = 50 if field_name == "appearance" else 35
-                    if len(words) > max_words:
-                        value = " ".join(words[:max_words]) + "..."
-                    field_values[field_name] = value
-                    self._field_update(f"character.{char_tag}.{field_name}", value, "complete")
-
-            characters.append(Character(
+                    continue
+
+                # Allow longer descriptions for appearance (50 words) and clothing (35 words)
+                max_words = 50 if field_name == "appearance" else 35
+                value = _truncate_words(value, max_words, max_words)
+                field_values[field_name] = value
+                self._field_update(f"character.{char_tag}.{field_name}", value, "complete")
+
+            values_by_idx[idx] = field_values
+            self._entity_done()
+            self._log(f"    [OK] {char_name} complete")
+
+        # Assemble in original entity order
+        characters = []
+        for idx, (char_data, (char_name, char_tag)) in enumerate(zip(char_entities, char_tags)):
+            field_values = values_by_idx.get(idx, {})
+            # All-string fields we just trimmed ourselves — no validation
+            characters.append(Character.model_construct(
                 tag=char_tag,
                 name=char_name,
                 role=char_data.get("role_hint", "supporting"),
@@ -556,8 +765,6 @@ Generate the {field_name} for this character."""
                 summary=field_values.get("summary", ""),
             ))
 
-            self._log(f"    [OK] {char_name} complete")
-
         return characters
 
     async def _generate_locations(
@@ -570,58 +777,70 @@ Generate the {field_name} for this character."""
         if not loc_entities:
             return []
 
-        locations = []
-
-        for loc_data in loc_entities:
-            loc_name = loc_data.get("name", "Unknown")
-            loc_tag = loc_data.get("tag", f"LOC_{loc_name.upper().replace(' ', '_')}")
+        field_names = LOCATION_FIELDS
 
-            self._log(f"  Generating {loc_name}...")
-
-            # Build prompts for all location fields
-            prompts = []
-            field_names = list(LOCATION_FIELD_PROMPTS.keys())
-
-            world_context_str = f"""WORLD CONTEXT:
+        world_context_str = f"""WORLD CONTEXT:
 Time Period: {world_context.time_period}
 Architecture Style: {world_context.architecture_style}
 Lighting Style: {world_context.lighting_style}
 Color Palette: {world_context.color_palette}"""
 
+        # One row-marshaled JSON call per location: the five fields share
+        # an identical prefix, so packing them into a single response pays
+        # the prefill once instead of five times (see CHARACTER_BATCH_PROMPT)
+        prompts = []
+        loc_tags = []
+        for loc_data in loc_entities:
+            loc_name = loc_data.get("name", "Unknown")
+            loc_tag = loc_data.get("tag") or f"LOC_{loc_name.upper().replace(' ', '_')}"
+            loc_tags.append((loc_name, loc_tag))
+
+            self._log(f"  Generating {loc_name}...")
+
             # Extract location-specific context from full story
             loc_context = self._extract_entity_context(loc_name, source_text)
 
-            for field_name in field_names:
-                system_prompt = LOCATION_FIELD_PROMPTS[field_name]
-                user_prompt = f"""LOCATION: {loc_name}
-TAG: {loc_tag}
+            # World context leads for cross-location prefix caching
+            shared_context = f"""{world_context_str}
 
-{world_context_str}
+LOCATION: {loc_name}
+TAG: {loc_tag}
 
 LOCATION CONTEXT FROM STORY:
-{loc_context}
+{loc_context}"""
 
-Generate the {field_name.replace('_', ' ')} for this location."""
+            prompts.append((LOCATION_BATCH_PROMPT, shared_context))
 
-                prompts.append((user_prompt, system_prompt))
+        # Show spinners for every field before launching
+        for _, loc_tag in loc_tags:
+            for field_name in field_names:
+                self._field_update(f"location.{loc_tag}.{field_name}", "", "pending")
 
-            # Generate all fields in parallel
-            results = await generate_parallel(prompts, max_tokens=150)
+        # Stream: each location's fields fire together as its call resolves
+        values_by_loc: dict[int, dict] = {i: {} for i in range(len(loc_tags))}
+        async for idx, result in self.llm.generate_streaming(
+            prompts, max_tokens=LOCATION_BATCH_MAX_TOKENS, structured=True
+        ):
+            loc_name, loc_tag = loc_tags[idx]
 
-            # Build Location from results
-            field_values = {}
-            for field_name, result in zip(field_names, results):
-                if isinstance(result, Exception):
-                    field_values[field_name] = ""
-                else:
-                    value = result.strip()
-                    words = value.split()
-                    if len(words) > 25:
-                        value = " ".join(words[:20]) + "..."
-                    field_values[field_name] = value
-                    self._field_update(f"location.{loc_tag}.{field_name}", value, "complete")
-
-            locations.append(Location(
+            if isinstance(result, Exception):
+                logger.warning(f"Location generation failed for {loc_name}: {result}")
+                for field_name in field_names:
+                    self._field_update(f"location.{loc_tag}.{field_name}", "", "failed")
+                self._entity_done()
+                continue
+
+            for field_name in field_names:
+                value = _truncate_words(str(result.get(field_name, "")).strip(), 25, 20)
+                values_by_loc[idx][field_name] = value
+                self._field_update(f"location.{loc_tag}.{field_name}", value, "complete")
+            self._entity_done()
+
+        # Assemble in original entity order
+        locations = []
+        for loc_idx, (loc_name, loc_tag) in enumerate(loc_tags):
+            field_values = values_by_loc[loc_idx]
+            locations.append(Location.model_construct(
                 tag=loc_tag,
                 name=loc_name,
                 description=field_values.get("description", ""),
@@ -645,55 +864,138 @@ Generate the {field_name.replace('_', ' ')} for this location."""
         if not prop_entities:
             return []
 
-        props = []
+        # Identical for every prop — build once outside the loop
+        world_context_str = f"""WORLD CONTEXT:
+Time Period: {world_context.time_period}
+Technology Level: {world_context.technology_level}"""
 
-        # Props are simpler - just description
+        # Props are simpler - just description. One batch instead of a
+        # sequential await per prop (each waiting out the previous
+        # network round-trip).
+        prompts = []
+        prop_tags = []
         for prop_data in prop_entities:
             prop_name = prop_data.get("name", "Unknown")
-            prop_tag = prop_data.get("tag", f"PROP_{prop_name.upper().replace(' ', '_')}")
-
-            world_context_str = f"""WORLD CONTEXT:
-Time Period: {world_context.time_period}
-Technology Level: {world_context.technology_level}"""
+            prop_tag = prop_data.get("tag") or f"PROP_{prop_name.upper().replace(' ', '_')}"
+            prop_tags.append((prop_name, prop_tag))
 
             # Extract prop-specific context from full story
             prop_context = self._extract_entity_context(prop_name, source_text)
 
-            prompt = f"""PROP: {prop_name}
-TAG: {prop_tag}
+            prompt = f"""{world_context_str}
 
-{world_context_str}
+PROP: {prop_name}
+TAG: {prop_tag}
 
 PROP CONTEXT FROM STORY:
 {prop_context}
 
 Generate a brief description (10-24 words) of this prop's appearance and significance."""
 
-            try:
-                result = await self.llm.generate(
-                    prompt=prompt,
-                    system_prompt=PROP_FIELD_PROMPTS["description"],
-                    max_tokens=150,
-                )
+            prompts.append((prompt, PROP_FIELD_PROMPTS["description"]))
+            self._field_update(f"prop.{prop_tag}.description", "", "pending")
+
+        descriptions: dict[int, str] = {}
+        async for idx, result in self.llm.generate_streaming(prompts, max_tokens=PROP_MAX_TOKENS):
+            prop_name, prop_tag = prop_tags[idx]
+            if isinstance(result, Exception):
+                logger.warning(f"Prop generation failed for {prop_name}: {result}")
+                self._field_update(f"prop.{prop_tag}.description", "", "failed")
+                self._entity_done()
+                continue
 
-                description = result.strip()
-                words = description.split()
-                if len(words) > 30:
-                    description = " ".join(words[:24]) + "..."
+            description = _truncate_words(result.strip(), 30, 24)
+            descriptions[idx] = description
+            self._field_update(f"prop.{prop_tag}.description", description, "complete")
+            self._entity_done()
 
-                self._field_update(f"prop.{prop_tag}.description", description, "complete")
+        return [
+            Prop.model_construct(
+                tag=prop_tag, name=prop_name, description=descriptions.get(idx, "")
+            )
+            for idx, (prop_name, prop_tag) in enumerate(prop_tags)
+        ]
 
-                props.append(Prop(
-                    tag=prop_tag,
-                    name=prop_name,
-                    description=description,
-                ))
+    def _entity_done(self) -> None:
+        """Advance overall progress as any phase finishes one entity.
 
-            except Exception as e:
-                logger.warning(f"Prop generation failed for {prop_name}: {e}")
-                props.append(Prop(tag=prop_tag, name=prop_name))
+        The three entity phases run concurrently, so progress interleaves;
+        the 0.25-0.90 window is split evenly across all entities.
+        """
+        self._entities_done += 1
+        if self._entities_total:
+            self._progress(
+                0.25 + 0.65 * min(1.0, self._entities_done / self._entities_total)
+            )
 
-        return props
+    def _build_mention_index(self, entities: dict, source_text: str) -> None:
+        """Map every entity to the paragraphs that mention it, in one scan.
+
+        Per-entity substring scans cost O(entities x paragraphs) in Python.
+        A single compiled alternation over every entity name and name-part
+        walks the lowercased text once at C speed instead; the extract
+        helpers then just look up their paragraph indices. Matching is
+        non-overlapping and longest-first, so a token nested inside a
+        longer one ("chou" in "madame chou") never matches on its own —
+        each token's owners are folded into every token that contains it,
+        crediting the nested entity anyway. Entities the regex never saw
+        at all are left out of the index, so the extract helpers' linear
+        scan genuinely covers them.
+        """
+        self._mention_index = {}
+        if not source_text:
+            return
+
+        # token -> entity keys that claim it (full name plus parts > 2 chars)
+        owners: dict[str, set[str]] = {}
+        for ent_list in entities.values():
+            for ent in ent_list:
+                name = ent.get("name", "")
+                if not name:
+                    continue
+                key = name.lower()
+                tokens = {key} | {p.lower() for p in name.split() if len(p) > 2}
+                for tok in tokens:
+                    owners.setdefault(tok, set()).add(key)
+
+        if not owners:
+            return
+
+        # A match on a longer token implies every token it contains also
+        # occurred there — propagate those owners up before matching
+        for tok, keys in owners.items():
+            for other, other_keys in owners.items():
+                if tok is not other and tok in other:
+                    other_keys |= keys
+
+        # Longest-first so full names win over their own parts
+        pattern = re.compile("|".join(
+            re.escape(tok) for tok in sorted(owners, key=len, reverse=True)
+        ))
+
+        hits: dict[str, set[int]] = {}
+        _, paras_lower = self._split_paragraphs(source_text)
+        for p_idx, para_lower in enumerate(paras_lower):
+            for match in pattern.finditer(para_lower):
+                for key in owners[match.group()]:
+                    hits.setdefault(key, set()).add(p_idx)
+
+        self._mention_index = {key: sorted(idxs) for key, idxs in hits.items()}
+
+    def _split_paragraphs(self, source_text: str) -> tuple[list[str], list[str]]:
+        """Split and lowercase the source text into paragraphs once.
+
+        Returns (paragraphs, lowercased paragraphs). Every entity's context
+        extraction scans the same paragraph list, so both the split and the
+        per-paragraph lowercasing are computed once per source text instead
+        of once per entity.
+        """
+        if self._paragraph_cache and self._paragraph_cache[0] == id(source_text):
+            return self._paragraph_cache[1], self._paragraph_cache[2]
+        paragraphs = source_text.split('\n\n')
+        paras_lower = [p.lower() for p in paragraphs]
+        self._paragraph_cache = (id(source_text), paragraphs, paras_lower)
+        return paragraphs, paras_lower
 
     def _extract_character_context(self, char_name: str, source_text: str, max_chars: int = 4000) -> str:
         """Extract paragraphs mentioning a specific character from the source text.
@@ -704,19 +1006,26 @@ Generate a brief description (10-24 words) of this prop's appearance and signifi
         if not source_text or not char_name:
             return source_text[:max_chars] if source_text else ""
 
-        # Split into paragraphs
-        paragraphs = source_text.split('\n\n')
-        relevant_paragraphs = []
+        paragraphs, paras_lower = self._split_paragraphs(source_text)
         name_lower = char_name.lower()
 
-        # Also check for partial name matches (e.g., "Dr. Watanabe" matches "Watanabe")
-        name_parts = char_name.split()
+        if self._mention_index is not None and name_lower in self._mention_index:
+            relevant_paragraphs = [
+                paragraphs[i].strip() for i in self._mention_index[name_lower]
+            ]
+        else:
+            relevant_paragraphs = []
+
+            # Also check for partial name matches (e.g., "Dr. Watanabe"
+            # matches "Watanabe") — lowercased once, not per paragraph
+            parts_lower = frozenset(
+                part.lower() for part in char_name.split() if len(part) > 2
+            )
 
-        for para in paragraphs:
-            para_lower = para.lower()
-            # Check if character name or any name part is in paragraph
-            if name_lower in para_lower or any(part.lower() in para_lower for part in name_parts if len(part) > 2):
-                relevant_paragraphs.append(para.strip())
+            for para, para_lower in zip(paragraphs, paras_lower):
+                # Check if character name or any name part is in paragraph
+                if name_lower in para_lower or any(part in para_lower for part in parts_lower):
+                    relevant_paragraphs.append(para.strip())
 
         if relevant_paragraphs:
             # Join relevant paragraphs up to max_chars
@@ -733,19 +1042,25 @@ Generate a brief description (10-24 words) of this prop's appearance and signifi
         if not source_text or not entity_name:
             return source_text[:max_chars] if source_text else ""
 
-        # Split into paragraphs
-        paragraphs = source_text.split('\n\n')
-        relevant_paragraphs = []
+        paragraphs, paras_lower = self._split_paragraphs(source_text)
         name_lower = entity_name.lower()
 
-        # Also check for partial matches
-        name_parts = [p for p in entity_name.split() if len(p) > 2]
+        if self._mention_index is not None and name_lower in self._mention_index:
+            relevant_paragraphs = [
+                paragraphs[i].strip() for i in self._mention_index[name_lower]
+            ]
+        else:
+            relevant_paragraphs = []
+
+            # Also check for partial matches — lowercased once, not per paragraph
+            parts_lower = frozenset(
+                p.lower() for p in entity_name.split() if len(p) > 2
+            )
 
-        for para in paragraphs:
-            para_lower = para.lower()
-            # Check if entity name or significant parts are in paragraph
-            if name_lower in para_lower or any(part.lower() in para_lower for part in name_parts):
-                relevant_paragraphs.append(para.strip())
+            for para, para_lower in zip(paragraphs, paras_lower):
+                # Check if entity name or significant parts are in paragraph
+                if name_lower in para_lower or any(part in para_lower for part in parts_lower):
+                    relevant_paragraphs.append(para.strip())
 
         if relevant_paragraphs:
             context = "\n\n".join(relevant_paragraphs)
@@ -758,10 +1073,12 @@ Generate a brief description (10-24 words) of this prop's appearance and signifi
 
     def _extract_title(self, source_text: str) -> str:
         """Extract or generate a title from source text."""
-        # Simple heuristic: look for common title patterns
-        lines = source_text.split('\n')
-        for line in lines[:10]:
-            line = line.strip()
+        # Simple heuristic: look for common title patterns in the first
+        # lines. Bound the scan to the head of the document — a title
+        # never lives past the first couple of KB, and this keeps a
+        # pathological unbroken first line from being copied wholesale.
+        for match in itertools.islice(_LINE_RE.finditer(source_text[:2048]), 10):
+            line = match.group().strip()
             # Skip empty lines and very long lines
             if not line or len(line) > 100:
                 continue
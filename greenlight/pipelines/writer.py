@@ -12,15 +12,18 @@ Flow:
 The world context rolls over to inform ALL entity extraction and enrichment.
 """
 
-import json
+import asyncio
 import logging
 import re
 from collections import Counter
 from pathlib import Path
-from typing import Callable, Optional
-from datetime import datetime
+from typing import Callable, NamedTuple, Optional, Type, TypeVar
 
-from greenlight.core.llm import LLMClient, generate_parallel
+import jiter  # Rust JSON parser, tolerant of partial documents
+from pydantic import BaseModel, ValidationError
+
+from greenlight.core.llm import LLMClient
+from greenlight.utils.file_ops import update_project_timestamp
 from greenlight.core.models import (
     PipelineStage,
     WorldContext,
@@ -35,6 +38,52 @@ from greenlight.core.models import (
 
 logger = logging.getLogger(__name__)
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Fenced ```json block first, widest brace span as the fallback branch —
+# one linear scan instead of the find/rfind probing it replaces
+_JSON_RE = re.compile(r"```json\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
+
+# One gate validates an extracted tag and names its bucket; also rejects
+# malformed tags (spaces, stray punctuation) that a prefix check lets by
+_ENT_PREFIX_RE = re.compile(r"^(CHAR|LOC|PROP)_[A-Z0-9_]+$")
+
+
+# Enrichment payload shapes. Parsing straight into these via
+# model_validate_json fuses JSON decode and validation into one
+# pydantic-core pass — no intermediate dict, no per-field .get chain.
+class _CharacterEnrichment(BaseModel):
+    appearance: str = ""
+    clothing: str = ""
+    personality: str = ""
+    summary: str = ""
+
+
+class _LocationEnrichment(BaseModel):
+    description: str = ""
+    view_north: str = ""
+    view_east: str = ""
+    view_south: str = ""
+    view_west: str = ""
+
+
+# Lightweight records carried from consensus into enrichment — named
+# attribute access without the per-entity dict allocations
+class CharRec(NamedTuple):
+    tag: str
+    name: str
+    role: str
+
+
+class LocRec(NamedTuple):
+    tag: str
+    name: str
+
+
+class PropRec(NamedTuple):
+    tag: str
+    name: str
+
 
 # =============================================================================
 # SYSTEM PROMPTS
@@ -87,28 +136,42 @@ Focus on: atmosphere, setting elements, background characters, environmental det
 Include elements that establish the world even if not plot-critical.""",
 }
 
-ENTITY_EXTRACTION_TEMPLATE = """{perspective}
-
-WORLD CONTEXT (use for reference):
-Time Period: {time_period}
-Cultural Context: {cultural_context}
-Setting: {setting_rules}
+# All 5 perspectives run in ONE request: the multi-KB shared prefill
+# (world hints + pitch) is paid once instead of five times, and the five
+# extractions come back as one JSON array that consensus votes over
+MULTI_PERSPECTIVE_EXTRACTION_TEMPLATE = f"""WORLD CONTEXT (use for reference):
+Time Period: {{time_period}}
+Cultural Context: {{cultural_context}}
+Setting: {{setting_rules}}
 
 PITCH TEXT:
-{pitch}
-
-Extract entities as JSON with this format:
-{{
-    "characters": [
-        {{"tag": "CHAR_NAME", "name": "Display Name", "role": "protagonist/antagonist/supporting/love_interest/mentor"}}
-    ],
-    "locations": [
-        {{"tag": "LOC_NAME", "name": "Display Name"}}
-    ],
-    "props": [
-        {{"tag": "PROP_NAME", "name": "Display Name"}}
+{{pitch}}
+
+Extract entities FIVE separate times, once from each perspective below.
+Treat each pass as an INDEPENDENT analyst: do not copy entities between
+passes — include an entity only where that perspective genuinely calls
+for it.
+
+PERSPECTIVES:
+{chr(10).join(f"{i}. {name.upper()}: {text}" for i, (name, text) in enumerate(AGENT_PERSPECTIVES.items(), 1))}
+
+Output JSON with this format (exactly one extraction object per perspective, five total):
+{{{{
+    "extractions": [
+        {{{{
+            "perspective": "narrative",
+            "characters": [
+                {{{{"tag": "CHAR_NAME", "name": "Display Name", "role": "protagonist/antagonist/supporting/love_interest/mentor"}}}}
+            ],
+            "locations": [
+                {{{{"tag": "LOC_NAME", "name": "Display Name"}}}}
+            ],
+            "props": [
+                {{{{"tag": "PROP_NAME", "name": "Display Name"}}}}
+            ]
+        }}}}
     ]
-}}
+}}}}
 
 TAG FORMAT RULES:
 - Use CHAR_ prefix for characters, LOC_ for locations, PROP_ for props
@@ -204,7 +267,10 @@ class WriterPipeline:
         self._stage = stage_callback or (lambda *args: None)
         self._progress = progress_callback or (lambda x: None)
 
-        self.llm = LLMClient()
+        # Disk-backed cache: re-running the writer on an unchanged pitch
+        # answers the world-context, consensus, and enrichment calls from
+        # project-local cache files instead of the network
+        self.llm = LLMClient(cache_dir=self.project_path / ".cache" / "llm")
 
     async def run(self) -> dict:
         """Execute the writer pipeline."""
@@ -217,7 +283,8 @@ class WriterPipeline:
             if not pitch_path.exists():
                 return {"success": False, "error": "No pitch.md found"}
 
-            pitch_content = pitch_path.read_text(encoding="utf-8")
+            # Off-thread: a large pitch read must not stall the event loop
+            pitch_content = await asyncio.to_thread(pitch_path.read_text, encoding="utf-8")
             self._log(f"Loaded pitch ({len(pitch_content)} chars)")
             self._stage("Load Pitch", PipelineStage.COMPLETE.value)
 
@@ -226,8 +293,24 @@ class WriterPipeline:
             self._progress(0.05)
             self._log("Extracting world context (time period, culture, clothing)...")
 
-            world_data = await self._extract_world_context(pitch_content)
+            world_task = asyncio.create_task(self._extract_world_context(pitch_content))
+
+            # Speculative kickoff: the agents use world context only as
+            # soft reference hints and extract entities from the pitch
+            # itself, so the 5-agent batch starts now instead of idling
+            # through a full world-context round-trip. Consensus voting
+            # absorbs the wording drift from running without the hints.
+            entities_task = asyncio.create_task(
+                self._extract_entities_consensus(pitch_content, None)
+            )
+
+            try:
+                world_data = await world_task
+            except BaseException:
+                entities_task.cancel()
+                raise
             if not world_data:
+                entities_task.cancel()
                 return {"success": False, "error": "Failed to extract world context"}
 
             world_context = WorldContext(
@@ -252,7 +335,7 @@ class WriterPipeline:
             self._stage("Extract Entities (5-Agent Consensus)", PipelineStage.RUNNING.value)
             self._log("Running 5-agent consensus extraction...")
 
-            entities = await self._extract_entities_consensus(pitch_content, world_context)
+            entities = await entities_task
 
             self._log(f"Consensus: {len(entities['characters'])} characters, "
                      f"{len(entities['locations'])} locations, "
@@ -264,8 +347,13 @@ class WriterPipeline:
             self._stage("Enrich Entities", PipelineStage.RUNNING.value)
             self._log("Enriching entities with world context...")
 
-            characters = await self._enrich_characters(entities["characters"], world_context)
-            locations = await self._enrich_locations(entities["locations"], world_context)
+            # Character and location enrichment are independent LLM batches;
+            # run them concurrently so Stage 4 costs max(chars, locs), not
+            # the sum
+            characters, locations = await asyncio.gather(
+                self._enrich_characters(entities["characters"], world_context),
+                self._enrich_locations(entities["locations"], world_context),
+            )
             props = self._create_props(entities["props"])
 
             self._log(f"Enriched {len(characters)} characters, {len(locations)} locations")
@@ -313,23 +401,26 @@ class WriterPipeline:
             # Save world_config.json
             world_bible_dir = self.project_path / "world_bible"
             world_bible_dir.mkdir(parents=True, exist_ok=True)
+            # model_dump_json serializes in one pydantic-core pass instead
+            # of model_dump building a full intermediate dict tree for
+            # stdlib json to walk again
             world_config_path = world_bible_dir / "world_config.json"
-            world_config_path.write_text(
-                json.dumps(world_config.model_dump(), indent=2),
-                encoding="utf-8"
+            await asyncio.to_thread(
+                world_config_path.write_bytes,
+                world_config.model_dump_json(indent=2).encode("utf-8"),
             )
             self._log("Saved world_config.json")
 
             # Save story_outline.json
             outline_path = self.project_path / "story_outline.json"
-            outline_path.write_text(
-                json.dumps(story_outline.model_dump(), indent=2),
-                encoding="utf-8"
+            await asyncio.to_thread(
+                outline_path.write_bytes,
+                story_outline.model_dump_json(indent=2).encode("utf-8"),
             )
             self._log("Saved story_outline.json")
 
-            # Update project.json timestamp
-            self._update_project_timestamp()
+            # Update project.json timestamp (read-modify-write off-thread)
+            await asyncio.to_thread(self._update_project_timestamp)
 
             self._stage("Save Outputs", PipelineStage.COMPLETE.value)
             self._progress(1.0)
@@ -368,118 +459,156 @@ Output only valid JSON."""
             return None
 
     async def _extract_entities_consensus(
-        self, pitch: str, world_context: WorldContext
+        self, pitch: str, world_context: Optional[WorldContext]
     ) -> dict:
         """
         Run 5-agent consensus entity extraction.
 
-        Each agent extracts entities from their perspective.
-        Only entities with ≥80% agreement (4/5 agents) are accepted.
-        This removes hallucinated entities.
+        Each agent extracts entities from their perspective — all five in
+        one batched LLM call, so the shared prefill (world hints + pitch)
+        is computed once. Only entities with ≥80% agreement (4/5 agents)
+        are accepted. This removes hallucinated entities.
+
+        world_context may be None when extraction is launched speculatively
+        alongside the world-context call; the hints then read as pending.
         """
-        # Build prompts for all 5 agents
-        prompts = []
-        for perspective_name, perspective_prompt in AGENT_PERSPECTIVES.items():
-            prompt = ENTITY_EXTRACTION_TEMPLATE.format(
-                perspective=perspective_prompt,
-                time_period=world_context.time_period,
-                cultural_context=world_context.cultural_context,
-                setting_rules=", ".join(world_context.setting_rules),
-                pitch=pitch,
+        if world_context is not None:
+            time_period = world_context.time_period
+            cultural_context = world_context.cultural_context
+            setting_rules = ", ".join(world_context.setting_rules)
+        else:
+            time_period = cultural_context = setting_rules = (
+                "(being established in parallel — infer from the pitch itself)"
             )
-            prompts.append((prompt, ""))  # No system prompt, it's in the user prompt
 
-        # Run all 5 agents in parallel
-        self._log("  Running 5 agents in parallel...")
-        results = await generate_parallel(prompts, max_tokens=2048)
+        prompt = MULTI_PERSPECTIVE_EXTRACTION_TEMPLATE.format(
+            time_period=time_period,
+            cultural_context=cultural_context,
+            setting_rules=setting_rules,
+            pitch=pitch,
+        )
+
+        # One request carries all 5 perspectives
+        self._log("  Running 5 agent perspectives in one batched call...")
+        extractions: list = []
+        try:
+            response = await self.llm.generate(prompt, max_tokens=4096, json_mode=True)
+            # The 5-perspective payload is the largest parse in the
+            # pipeline; off-thread so the concurrent world-context call
+            # keeps receiving bytes while it decodes
+            data = await asyncio.to_thread(self._extract_json, response)
+            if data:
+                extractions = data.get("extractions", [])
+        except Exception as e:
+            logger.error(f"Consensus extraction call failed: {e}")
 
         # Parse results from each agent
         all_characters = []
         all_locations = []
         all_props = []
 
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.warning(f"Agent {i} failed: {result}")
-                continue
-
+        for i, data in enumerate(extractions):
             try:
-                data = self._extract_json(result)
-                if data:
-                    # Normalize tags to uppercase
-                    for char in data.get("characters", []):
-                        tag = char.get("tag", "").upper()
-                        if tag and tag.startswith("CHAR_"):
-                            all_characters.append((tag, char.get("name", ""), char.get("role", "")))
-
-                    for loc in data.get("locations", []):
-                        tag = loc.get("tag", "").upper()
-                        if tag and tag.startswith("LOC_"):
-                            all_locations.append((tag, loc.get("name", "")))
-
-                    for prop in data.get("props", []):
-                        tag = prop.get("tag", "").upper()
-                        if tag and tag.startswith("PROP_"):
-                            all_props.append((tag, prop.get("name", "")))
+                if isinstance(data, dict):
+                    # Normalize tags to uppercase and deduplicate within
+                    # the agent — one agent listing a tag twice must count
+                    # as a single vote toward consensus. A single regex
+                    # gate validates the tag and names its bucket.
+                    agent_chars: dict[str, CharRec] = {}
+                    agent_locs: dict[str, LocRec] = {}
+                    agent_props: dict[str, PropRec] = {}
+                    for entry in (
+                        data.get("characters", [])
+                        + data.get("locations", [])
+                        + data.get("props", [])
+                    ):
+                        tag = entry.get("tag", "").upper()
+                        match = _ENT_PREFIX_RE.match(tag)
+                        if match is None:
+                            continue
+                        kind = match.group(1)
+                        if kind == "CHAR":
+                            if tag not in agent_chars:
+                                agent_chars[tag] = CharRec(
+                                    tag, entry.get("name", ""), entry.get("role", "")
+                                )
+                        elif kind == "LOC":
+                            if tag not in agent_locs:
+                                agent_locs[tag] = LocRec(tag, entry.get("name", ""))
+                        elif tag not in agent_props:
+                            agent_props[tag] = PropRec(tag, entry.get("name", ""))
+
+                    all_characters.extend(agent_chars.values())
+                    all_locations.extend(agent_locs.values())
+                    all_props.extend(agent_props.values())
             except Exception as e:
-                logger.warning(f"Failed to parse agent {i} result: {e}")
+                logger.warning(f"Failed to parse perspective {i} extraction: {e}")
 
         # Apply consensus (80% = 4/5 agents)
         consensus_threshold = 0.8
         num_agents = 5
 
-        def apply_consensus(items: list) -> list:
-            """Keep only items that appear in ≥80% of agents."""
-            tag_counts = Counter(item[0] for item in items)
-            consensus_tags = {
-                tag for tag, count in tag_counts.items()
-                if count / num_agents >= consensus_threshold
-            }
+        def apply_consensus(items: list) -> tuple[list, int]:
+            """Keep only items that appear in ≥80% of agents.
 
-            # Get the first occurrence with full data for each consensus tag
-            seen = set()
-            result = []
+            One pass builds both the vote counts and the first-seen
+            record per tag; Counter and first_seen share iteration
+            order, so the filtered comprehension preserves first
+            appearance. Returns (accepted, distinct_found).
+            """
+            first_seen: dict[str, tuple] = {}
+            counts: Counter = Counter()
             for item in items:
-                if item[0] in consensus_tags and item[0] not in seen:
-                    seen.add(item[0])
-                    result.append(item)
-            return result
+                tag = item[0]
+                counts[tag] += 1
+                if tag not in first_seen:
+                    first_seen[tag] = item
+            accepted = [
+                first_seen[tag] for tag, count in counts.items()
+                if count / num_agents >= consensus_threshold
+            ]
+            return accepted, len(first_seen)
 
-        consensus_chars = apply_consensus(all_characters)
-        consensus_locs = apply_consensus(all_locations)
-        consensus_props = apply_consensus(all_props)
+        consensus_chars, chars_found = apply_consensus(all_characters)
+        consensus_locs, locs_found = apply_consensus(all_locations)
+        consensus_props, props_found = apply_consensus(all_props)
 
         self._log(f"  Consensus threshold: {consensus_threshold * 100}%")
-        self._log(f"  Characters: {len(set(c[0] for c in all_characters))} found → {len(consensus_chars)} accepted")
-        self._log(f"  Locations: {len(set(l[0] for l in all_locations))} found → {len(consensus_locs)} accepted")
-        self._log(f"  Props: {len(set(p[0] for p in all_props))} found → {len(consensus_props)} accepted")
+        self._log(f"  Characters: {chars_found} found → {len(consensus_chars)} accepted")
+        self._log(f"  Locations: {locs_found} found → {len(consensus_locs)} accepted")
+        self._log(f"  Props: {props_found} found → {len(consensus_props)} accepted")
 
+        # The records pass straight into enrichment — no dict-per-entity hop
         return {
-            "characters": [{"tag": c[0], "name": c[1], "role": c[2]} for c in consensus_chars],
-            "locations": [{"tag": l[0], "name": l[1]} for l in consensus_locs],
-            "props": [{"tag": p[0], "name": p[1]} for p in consensus_props],
+            "characters": consensus_chars,
+            "locations": consensus_locs,
+            "props": consensus_props,
         }
 
     async def _enrich_characters(
-        self, characters: list[dict], world_context: WorldContext
+        self, characters: list[CharRec], world_context: WorldContext
     ) -> list[Character]:
         """Enrich characters with world-context-aware details."""
         if not characters:
             return []
 
-        # Build prompts for all characters
-        prompts = []
-        for char in characters:
-            prompt = f"""Enrich this character:
-Tag: {char['tag']}
-Name: {char['name']}
-Role: {char.get('role', 'supporting')}
-
-WORLD CONTEXT (character must fit this setting):
+        # Shared world block built once and placed first: the prompts for
+        # all characters then share one prefix (system prompt + world
+        # context) that the provider's KV cache reuses across the batch
+        world_block = f"""WORLD CONTEXT (character must fit this setting):
 Time Period: {world_context.time_period}
 Cultural Context: {world_context.cultural_context}
 Clothing Norms: {world_context.clothing_norms}
-Social Structure: {world_context.social_structure}
+Social Structure: {world_context.social_structure}"""
+
+        prompts = []
+        for char in characters:
+            prompt = f"""{world_block}
+
+Enrich this character:
+Tag: {char.tag}
+Name: {char.name}
+Role: {char.role or 'supporting'}
 
 Generate appearance, clothing (MUST match world context clothing norms), personality, and summary.
 Output only valid JSON."""
@@ -487,67 +616,62 @@ Output only valid JSON."""
             prompts.append((prompt, CHARACTER_ENRICHMENT_SYSTEM))
 
         # Run enrichment in parallel
-        results = await generate_parallel(prompts, max_tokens=1024)
+        results = await self.llm.generate_batch(prompts, max_tokens=1024)
 
         enriched = []
         for i, (char, result) in enumerate(zip(characters, results)):
+            role = char.role or "supporting"
             if isinstance(result, Exception):
-                logger.warning(f"Character enrichment failed for {char['tag']}: {result}")
+                logger.warning(f"Character enrichment failed for {char.tag}: {result}")
                 # Create basic character
-                enriched.append(Character(
-                    tag=char["tag"],
-                    name=char["name"],
-                    role=char.get("role", "supporting"),
-                ))
+                enriched.append(Character(tag=char.tag, name=char.name, role=role))
                 continue
 
             try:
-                data = self._extract_json(result)
+                # Parse off-thread: the location batch runs concurrently
+                # and must not stall behind this loop's decoding
+                data = await asyncio.to_thread(
+                    self._extract_json_as, result, _CharacterEnrichment
+                )
                 if data:
                     enriched.append(Character(
-                        tag=char["tag"],
-                        name=char["name"],
-                        role=char.get("role", "supporting"),
-                        appearance=data.get("appearance", ""),
-                        clothing=data.get("clothing", ""),
-                        personality=data.get("personality", ""),
-                        summary=data.get("summary", ""),
+                        tag=char.tag,
+                        name=char.name,
+                        role=role,
+                        appearance=data.appearance,
+                        clothing=data.clothing,
+                        personality=data.personality,
+                        summary=data.summary,
                     ))
                 else:
-                    enriched.append(Character(
-                        tag=char["tag"],
-                        name=char["name"],
-                        role=char.get("role", "supporting"),
-                    ))
+                    enriched.append(Character(tag=char.tag, name=char.name, role=role))
             except Exception as e:
                 logger.warning(f"Failed to parse character enrichment: {e}")
-                enriched.append(Character(
-                    tag=char["tag"],
-                    name=char["name"],
-                    role=char.get("role", "supporting"),
-                ))
+                enriched.append(Character(tag=char.tag, name=char.name, role=role))
 
         return enriched
 
     async def _enrich_locations(
-        self, locations: list[dict], world_context: WorldContext
+        self, locations: list[LocRec], world_context: WorldContext
     ) -> list[Location]:
         """Enrich locations with world-context-aware details and directional views."""
         if not locations:
             return []
 
-        # Build prompts for all locations
-        prompts = []
-        for loc in locations:
-            prompt = f"""Enrich this location:
-Tag: {loc['tag']}
-Name: {loc['name']}
-
-WORLD CONTEXT (location must fit this setting):
+        # World block first so all locations share a cacheable prefix
+        world_block = f"""WORLD CONTEXT (location must fit this setting):
 Time Period: {world_context.time_period}
 Architecture Style: {world_context.architecture_style}
 Cultural Context: {world_context.cultural_context}
-Lighting Style: {world_context.lighting_style}
+Lighting Style: {world_context.lighting_style}"""
+
+        prompts = []
+        for loc in locations:
+            prompt = f"""{world_block}
+
+Enrich this location:
+Tag: {loc.tag}
+Name: {loc.name}
 
 Generate description and 4 directional views (what you see looking N/E/S/W).
 Output only valid JSON."""
@@ -555,38 +679,40 @@ Output only valid JSON."""
             prompts.append((prompt, LOCATION_ENRICHMENT_SYSTEM))
 
         # Run enrichment in parallel
-        results = await generate_parallel(prompts, max_tokens=1024)
+        results = await self.llm.generate_batch(prompts, max_tokens=1024)
 
         enriched = []
         for loc, result in zip(locations, results):
             if isinstance(result, Exception):
-                logger.warning(f"Location enrichment failed for {loc['tag']}: {result}")
-                enriched.append(Location(tag=loc["tag"], name=loc["name"]))
+                logger.warning(f"Location enrichment failed for {loc.tag}: {result}")
+                enriched.append(Location(tag=loc.tag, name=loc.name))
                 continue
 
             try:
-                data = self._extract_json(result)
+                data = await asyncio.to_thread(
+                    self._extract_json_as, result, _LocationEnrichment
+                )
                 if data:
                     enriched.append(Location(
-                        tag=loc["tag"],
-                        name=loc["name"],
-                        description=data.get("description", ""),
-                        view_north=data.get("view_north", ""),
-                        view_east=data.get("view_east", ""),
-                        view_south=data.get("view_south", ""),
-                        view_west=data.get("view_west", ""),
+                        tag=loc.tag,
+                        name=loc.name,
+                        description=data.description,
+                        view_north=data.view_north,
+                        view_east=data.view_east,
+                        view_south=data.view_south,
+                        view_west=data.view_west,
                     ))
                 else:
-                    enriched.append(Location(tag=loc["tag"], name=loc["name"]))
+                    enriched.append(Location(tag=loc.tag, name=loc.name))
             except Exception as e:
                 logger.warning(f"Failed to parse location enrichment: {e}")
-                enriched.append(Location(tag=loc["tag"], name=loc["name"]))
+                enriched.append(Location(tag=loc.tag, name=loc.name))
 
         return enriched
 
-    def _create_props(self, props: list[dict]) -> list[Prop]:
+    def _create_props(self, props: list[PropRec]) -> list[Prop]:
         """Create prop objects (simple, no enrichment needed)."""
-        return [Prop(tag=p["tag"], name=p["name"]) for p in props]
+        return [Prop(tag=p.tag, name=p.name) for p in props]
 
     async def _generate_story_outline(
         self,
@@ -669,39 +795,57 @@ Output only valid JSON."""
         # Return empty outline on failure
         return StoryOutline(title=world_data.get("title", "Untitled"), status="draft")
 
-    def _extract_json(self, text: str) -> Optional[dict]:
-        """Extract JSON from LLM response."""
+    @staticmethod
+    def _json_candidates(text: str):
+        """Yield likely JSON substrings of an LLM response, best first."""
         if not text:
-            return None
+            return
+        match = _JSON_RE.search(text)
+        if match is None:
+            # No closing brace at all — response truncated mid-object;
+            # the partial-mode parse may still rescue it
+            start = text.find("{")
+            if start != -1:
+                yield text[start:]
+            return
+        fenced = match.group(1)
+        if fenced is not None:
+            yield fenced
+            # Fenced body that fails to parse: fall back to the widest
+            # brace span of the whole response
+            end = text.rfind("}")
+            if end > match.start(1):
+                yield text[match.start(1):end + 1]
+        else:
+            yield match.group(2)
 
-        # Try to find JSON block
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            if end > start:
-                try:
-                    return json.loads(text[start:end].strip())
-                except json.JSONDecodeError:
-                    pass
-
-        # Try to find raw JSON object
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start >= 0 and end > start:
+    def _extract_json(self, text: str) -> Optional[dict]:
+        """Extract JSON from LLM response."""
+        for candidate in self._json_candidates(text):
             try:
-                return json.loads(text[start:end])
-            except json.JSONDecodeError:
-                pass
+                # partial_mode rescues responses truncated at the
+                # max_tokens boundary, which json.loads would reject
+                parsed = jiter.from_json(candidate.encode("utf-8"), partial_mode=True)
+            except ValueError:
+                continue
+            if isinstance(parsed, dict):
+                return parsed
+        return None
+
+    def _extract_json_as(self, text: str, model_cls: Type[_ModelT]) -> Optional[_ModelT]:
+        """Extract JSON and validate it into a model in one pass.
 
+        model_validate_json parses and validates the payload inside
+        pydantic-core, skipping the intermediate dict that
+        json.loads + Model(**data) would build.
+        """
+        for candidate in self._json_candidates(text):
+            try:
+                return model_cls.model_validate_json(candidate)
+            except ValidationError:
+                continue
         return None
 
     def _update_project_timestamp(self):
         """Update project.json last_modified timestamp."""
-        config_path = self.project_path / "project.json"
-        if config_path.exists():
-            try:
-                config = json.loads(config_path.read_text(encoding="utf-8"))
-                config["last_modified"] = datetime.now().isoformat()
-                config_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
-            except Exception:
-                pass
+        update_project_timestamp(self.project_path)
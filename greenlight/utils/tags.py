@@ -7,6 +7,20 @@ No consensus voting, no multi-agent validation - just regex extraction.
 import re
 from typing import Optional
 
+# Compiled once at import; matches both [TAG] and bare TAG formats
+_TAG_RE = re.compile(
+    r'\[?((?:CHAR|LOC|PROP|CONCEPT|EVENT)_[A-Z0-9_]+)\]?',
+    re.IGNORECASE,
+)
+
+_BUCKET_BY_PREFIX = {
+    "CHAR": "characters",
+    "LOC": "locations",
+    "PROP": "props",
+    "CONCEPT": "concepts",
+    "EVENT": "events",
+}
+
 
 def extract_tags(text: str) -> dict[str, list[str]]:
     """
@@ -17,39 +31,19 @@ def extract_tags(text: str) -> dict[str, list[str]]:
 
     Returns:
         Dict with keys: characters, locations, props, concepts, events
+        (first-appearance order, deduplicated)
     """
-    tags = {
-        "characters": [],
-        "locations": [],
-        "props": [],
-        "concepts": [],
-        "events": [],
+    # Dicts give ordered O(1) dedup; the startswith chain with `in list`
+    # membership was O(n^2) on scripts with hundreds of tag mentions
+    buckets: dict[str, dict[str, None]] = {
+        name: {} for name in _BUCKET_BY_PREFIX.values()
     }
 
-    # Pattern matches both [TAG] and bare TAG formats
-    pattern = r'\[?(CHAR_[A-Z0-9_]+|LOC_[A-Z0-9_]+|PROP_[A-Z0-9_]+|CONCEPT_[A-Z0-9_]+|EVENT_[A-Z0-9_]+)\]?'
-
-    matches = re.findall(pattern, text, re.IGNORECASE)
-
-    for match in matches:
+    for match in _TAG_RE.findall(text):
         tag = match.upper()
-        if tag.startswith("CHAR_"):
-            if tag not in tags["characters"]:
-                tags["characters"].append(tag)
-        elif tag.startswith("LOC_"):
-            if tag not in tags["locations"]:
-                tags["locations"].append(tag)
-        elif tag.startswith("PROP_"):
-            if tag not in tags["props"]:
-                tags["props"].append(tag)
-        elif tag.startswith("CONCEPT_"):
-            if tag not in tags["concepts"]:
-                tags["concepts"].append(tag)
-        elif tag.startswith("EVENT_"):
-            if tag not in tags["events"]:
-                tags["events"].append(tag)
-
-    return tags
+        buckets[_BUCKET_BY_PREFIX[tag.split("_", 1)[0]]][tag] = None
+
+    return {name: list(seen) for name, seen in buckets.items()}
 
 
 def create_tag(prefix: str, name: str) -> str:
@@ -1,14 +1,11 @@
 """Pytest configuration for Project Greenlight tests."""
 
 import os
-import sys
 from pathlib import Path
 
 import pytest
 
-# Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 
 @pytest.fixture
@@ -1,25 +1,45 @@
 """
-CineStage Director Test - Batched by 5 scenes for consistent prompt length.
+CineStage Director Test - One parallel LLM call per beat.
 
 Approach:
-- Split 15 beats into 3 batches of 5
-- Each batch gets its own LLM call
-- Consistent 150-250 word prompts throughout
+- Each of the 15 beats gets its own small request (one scene, ~3 frames)
+- All requests dispatched together; LLMClient's loop-wide semaphore
+  bounds how many are in flight at once
+- Short per-call decode tail instead of waiting on a 16k-token batch
 """
 
 import asyncio
 import json
 import os
+import re
+import traceback
 from pathlib import Path
 from datetime import datetime
 import time
 
-# Add parent to path
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from greenlight.core.llm import LLMClient
 
+try:
+    import orjson  # optional: C-extension JSON, ~5-10x stdlib
+except ImportError:
+    orjson = None
+
+
+def _loads(text: str):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def _json_dump(obj, path: Path) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_bytes(json.dumps(obj, indent=2).encode("utf-8"))
+
+
+async def _awrite_json(obj, path: Path) -> None:
+    # Serialize + write off-thread so the event loop stays free
+    await asyncio.to_thread(_json_dump, obj, path)
+
 # =============================================================================
 # CINESTAGE SYSTEM PROMPT (Batch-optimized)
 # =============================================================================
@@ -144,111 +164,154 @@ LOCATIONS:
 - FLORIST SHOP: Humble wooden structure, flower buckets, pressed dirt floor
 - PRESSED DIRT ROAD: Evening lanterns, wooden buildings on sides, distant mountains"""
 
+# The world context rides in the system prompt so every per-beat call
+# shares one byte-identical prefix; the provider's implicit prompt cache
+# then only pays prefill for the short per-beat suffix
+SYSTEM_PROMPT_WITH_WORLD = CINESTAGE_SYSTEM_PROMPT + "\n\n" + WORLD_CONTEXT
 
-async def run_batch(llm: LLMClient, beats: list[str], scene_offset: int) -> dict:
-    """Process a batch of beats."""
-    beats_text = "\n".join([
-        f"{scene_offset + i + 1:02d}. {beat}"
-        for i, beat in enumerate(beats)
-    ])
+# Fenced block preferred, bare object as fallback — compiled once so the
+# response is scanned in a single pass per call
+_JSON_RE = re.compile(r"```json\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
 
-    user_prompt = f"""Convert these {len(beats)} story beats into scenes (scene numbers {scene_offset + 1}-{scene_offset + len(beats)}).
+# str.split materializes a list of every word just to count it; counting
+# regex matches walks the text once with no intermediate allocations
+_WORDS_RE = re.compile(r"\S+")
 
-{WORLD_CONTEXT}
 
-STORY BEATS:
-{beats_text}
+def _word_count(text: str) -> int:
+    return sum(1 for _ in _WORDS_RE.finditer(text))
 
-Generate ONE scene per beat with 2-4 frames each.
+
+# Built once at import: the static instruction text is byte-identical
+# across calls (good for the provider's prefix cache) and per-call cost
+# is one .format() instead of re-assembling the template
+_USER_PROMPT_TMPL = """Convert the following story beat into ONE scene with 2-4 frames.
 CRITICAL: Each frame prompt MUST be 200-300 words of visual poetry.
-Output ONLY valid JSON."""
+Output ONLY valid JSON.
+
+STORY BEAT (scene number {scene_number}):
+{scene_number:02d}. {beat}"""
+
+
+async def run_single_beat(llm: LLMClient, beat: str, scene_number: int) -> dict:
+    """Convert one beat into one scene via its own small request.
+
+    A per-beat call decodes ~3 frames instead of a 5-scene batch, so no
+    beat waits on the longest-generating scene sharing its request.
+    """
+    # Static instructions first, per-beat text last — keeps the cacheable
+    # prefix as long as possible across the 15 calls
+    user_prompt = _USER_PROMPT_TMPL.format(scene_number=scene_number, beat=beat)
 
     response = await llm.generate(
         prompt=user_prompt,
-        system_prompt=CINESTAGE_SYSTEM_PROMPT,
-        max_tokens=16000,
+        system_prompt=SYSTEM_PROMPT_WITH_WORLD,
+        max_tokens=3500,
         temperature=0.7,
     )
 
     # Parse JSON
-    if "```json" in response:
-        start = response.find("```json") + 7
-        end = response.find("```", start)
-        if end > start:
-            return json.loads(response[start:end].strip())
-
-    start = response.find("{")
-    end = response.rfind("}") + 1
-    if start >= 0 and end > start:
-        return json.loads(response[start:end])
-
-    raise ValueError("Could not parse JSON")
+    match = _JSON_RE.search(response)
+    if match is None:
+        raise ValueError("Could not parse JSON")
+    try:
+        data = _loads(match.group(1) or match.group(2))
+    except ValueError:
+        # Non-greedy fence match can stop at an inner brace; retry with
+        # the widest span before giving up
+        start = response.find("{")
+        end = response.rfind("}") + 1
+        data = _loads(response[start:end])
+
+    scenes = data.get("scenes", [])
+    if not scenes:
+        raise ValueError(f"No scene returned for beat {scene_number}")
+    return scenes[0]
 
 
 async def run_cinestage_batched_test():
     """Run the batched CineStage director test."""
     print("=" * 60)
-    print("CINESTAGE DIRECTOR TEST (BATCHED BY 5)")
+    print("CINESTAGE DIRECTOR TEST (ONE CALL PER BEAT)")
     print("=" * 60)
     print(f"Total Beats: {len(TEST_BEATS)}")
-    print(f"Batches: 3 (5 scenes each)")
     print(f"Model: Grok 4.1 Fast")
     print("=" * 60)
 
     llm = LLMClient()
     all_scenes = []
-    total_time = 0
-
-    # Process in batches of 5
-    batch_size = 5
-    batches = [
-        TEST_BEATS[i:i + batch_size]
-        for i in range(0, len(TEST_BEATS), batch_size)
-    ]
-
-    for batch_idx, batch_beats in enumerate(batches):
-        scene_offset = batch_idx * batch_size
-        print(f"\n[Batch {batch_idx + 1}/3] Processing scenes {scene_offset + 1}-{scene_offset + len(batch_beats)}...")
 
+    async def timed_beat(beat: str, scene_number: int):
         start_time = time.time()
-
         try:
-            result = await run_batch(llm, batch_beats, scene_offset)
-            elapsed = time.time() - start_time
-            total_time += elapsed
-
-            scenes = result.get("scenes", [])
-            frame_count = sum(len(s.get("frames", [])) for s in scenes)
-            print(f"           -> {len(scenes)} scenes, {frame_count} frames in {elapsed:.1f}s")
-
-            all_scenes.extend(scenes)
-
+            scene = await run_single_beat(llm, beat, scene_number)
         except Exception as e:
-            print(f"           -> ERROR: {e}")
-            import traceback
-            traceback.print_exc()
+            return scene_number, None, time.time() - start_time, e
+        return scene_number, scene, time.time() - start_time, None
+
+    # Every beat is independent — dispatch them all at once; the client's
+    # loop-wide semaphore keeps the in-flight count bounded, so the run
+    # costs the slowest scene plus queueing, not 15 serial round trips.
+    # Consume with as_completed so each scene is reported (and usable)
+    # the moment it lands instead of waiting for the whole fleet
+    print(f"\n[Dispatch] {len(TEST_BEATS)} beats concurrently...")
+    wall_start = time.time()
+    tasks = [
+        asyncio.ensure_future(timed_beat(beat, i + 1))
+        for i, beat in enumerate(TEST_BEATS)
+    ]
+    for fut in asyncio.as_completed(tasks):
+        scene_number, scene, elapsed, error = await fut
+        if error is not None:
+            print(f"[Beat {scene_number:02d}] ERROR: {error}")
+            traceback.print_exception(error)
+            continue
+
+        frame_count = len(scene.get("frames", []))
+        print(f"[Beat {scene_number:02d}] {frame_count} frames in {elapsed:.1f}s")
+        all_scenes.append(scene)
+    total_time = time.time() - wall_start
+
+    # as_completed yields in arrival order; restore story order
+    all_scenes.sort(key=lambda s: s.get("scene_number", 0))
+
+    # One pass over every frame builds the card list, the word-count
+    # distribution, and the frame total together; each prompt is counted
+    # exactly once and the per-scene fields are hoisted out of the
+    # inner loop
+    prompts = []
+    prompt_lengths = []
+    for scene in all_scenes:
+        scene_number = scene.get("scene_number", 0)
+        beat_preview = scene.get("beat", "")[:50] + "..."
+        for frame in scene.get("frames", []):
+            prompt = frame.get("prompt", "")
+            word_count = _word_count(prompt)
+            prompt_lengths.append(word_count)
+            prompts.append({
+                "frame_id": frame.get("frame_id", ""),
+                "scene_number": scene_number,
+                "beat": beat_preview,
+                "shot_type": frame.get("shot_type", ""),
+                "camera_position": frame.get("camera_position", ""),
+                "prompt": prompt,
+                "characters": frame.get("characters", []),
+                "word_count": word_count,
+                "generated": False,
+                "image_url": None,
+            })
+    total_frames = len(prompt_lengths)
 
     # Compile final output
     scene_graph = {
         "title": "Shadows of the Go Board",
         "created_at": datetime.now().isoformat(),
-        "pipeline": "cinestage-batched",
-        "batch_size": batch_size,
+        "pipeline": "cinestage-per-beat",
         "total_scenes": len(all_scenes),
+        "total_frames": total_frames,
         "scenes": all_scenes,
     }
 
-    total_frames = sum(len(s.get("frames", [])) for s in all_scenes)
-    scene_graph["total_frames"] = total_frames
-
-    # Analyze prompt lengths
-    prompt_lengths = []
-    for scene in all_scenes:
-        for frame in scene.get("frames", []):
-            prompt = frame.get("prompt", "")
-            word_count = len(prompt.split())
-            prompt_lengths.append(word_count)
-
     print("\n" + "=" * 60)
     print("RESULTS")
     print("=" * 60)
@@ -264,43 +327,27 @@ async def run_cinestage_batched_test():
         print(f"  Average: {avg_words:.0f} words")
         print(f"  Range: {min_words}-{max_words} words")
 
-        # Show distribution by batch
-        for batch_idx in range(3):
-            start = batch_idx * 5 * 3  # ~3 frames per scene
-            end = start + 15
-            batch_lengths = prompt_lengths[start:min(end, len(prompt_lengths))]
-            if batch_lengths:
-                batch_avg = sum(batch_lengths) / len(batch_lengths)
-                print(f"  Batch {batch_idx + 1}: avg {batch_avg:.0f} words")
+        # Show distribution across the run (first/middle/last third)
+        third = max(1, len(prompt_lengths) // 3)
+        for idx in range(3):
+            segment = prompt_lengths[idx * third:(idx + 1) * third]
+            if segment:
+                seg_avg = sum(segment) / len(segment)
+                print(f"  Third {idx + 1}: avg {seg_avg:.0f} words")
 
     # Save outputs
     output_dir = Path(__file__).parent / "cinestage_output_batched"
     output_dir.mkdir(exist_ok=True)
 
-    # Full scene graph
+    # Scene graph and prompt cards (for the card UI) are both ready —
+    # write them side by side off-thread
     sg_path = output_dir / "visual_script.json"
-    sg_path.write_text(json.dumps(scene_graph, indent=2), encoding="utf-8")
-    print(f"\nSaved: {sg_path}")
-
-    # Extracted prompts (for card UI)
-    prompts = []
-    for scene in all_scenes:
-        for frame in scene.get("frames", []):
-            prompts.append({
-                "frame_id": frame.get("frame_id", ""),
-                "scene_number": scene.get("scene_number", 0),
-                "beat": scene.get("beat", "")[:50] + "...",
-                "shot_type": frame.get("shot_type", ""),
-                "camera_position": frame.get("camera_position", ""),
-                "prompt": frame.get("prompt", ""),
-                "characters": frame.get("characters", []),
-                "word_count": len(frame.get("prompt", "").split()),
-                "generated": False,
-                "image_url": None,
-            })
-
     prompts_path = output_dir / "prompts.json"
-    prompts_path.write_text(json.dumps(prompts, indent=2), encoding="utf-8")
+    await asyncio.gather(
+        _awrite_json(scene_graph, sg_path),
+        _awrite_json(prompts, prompts_path),
+    )
+    print(f"\nSaved: {sg_path}")
     print(f"Saved: {prompts_path} ({len(prompts)} cards)")
 
     # Sample output
@@ -313,7 +360,7 @@ async def run_cinestage_batched_test():
         print(f"Shot: {first_frame.get('shot_type')}")
         print(f"Camera: {first_frame.get('camera_position')}")
         prompt = first_frame.get("prompt", "")
-        print(f"Prompt ({len(prompt.split())} words):\n")
+        print(f"Prompt ({_word_count(prompt)} words):\n")
         print(prompt[:600] + "..." if len(prompt) > 600 else prompt)
 
     # Also show a later scene to verify consistency
@@ -324,7 +371,7 @@ async def run_cinestage_batched_test():
         frame_10 = all_scenes[9]["frames"][0]
         print(f"Frame ID: {frame_10.get('frame_id')}")
         prompt = frame_10.get("prompt", "")
-        print(f"Prompt ({len(prompt.split())} words):\n")
+        print(f"Prompt ({_word_count(prompt)} words):\n")
         print(prompt[:400] + "..." if len(prompt) > 400 else prompt)
 
     print("\n" + "=" * 60)
@@ -14,17 +14,36 @@ After running, check:
 
 import asyncio
 import json
+import re
 import shutil
 from pathlib import Path
 from datetime import datetime
 
-# Add project root to path
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from greenlight.pipelines.director import DirectorPipeline, build_world_context
 from greenlight.pipelines.storyboard import StoryboardPipeline
 
+try:
+    import orjson  # optional: C-extension JSON, ~5-10x stdlib
+except ImportError:
+    orjson = None
+
+
+def _json_load(path: Path):
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _json_dump(obj, path: Path) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_bytes(json.dumps(obj, indent=2).encode("utf-8"))
+
+
+# All four issue keywords found in one scan of the prompt instead of a
+# lowered copy plus substring search per keyword
+_ISSUE_RE = re.compile(r"center|thirds|lattice|obscur", re.IGNORECASE)
+
 
 # Configuration
 SOURCE_PROJECT = Path(r"C:\Users\thriv\greenlight_projects\orchid's_gambit")
@@ -69,7 +88,7 @@ def setup_test_project():
 
     # Create limited outline with only NUM_BEATS
     src_outline = SOURCE_PROJECT / "outlines" / "confirmed_outline.json"
-    outline_data = json.loads(src_outline.read_text(encoding="utf-8"))
+    outline_data = _json_load(src_outline)
 
     # Limit beats
     original_beats = outline_data.get("beats", [])
@@ -80,7 +99,7 @@ def setup_test_project():
     outline_data["original_beat_count"] = len(original_beats)
 
     dst_outline = TEST_OUTPUT / "outlines" / "confirmed_outline.json"
-    dst_outline.write_text(json.dumps(outline_data, indent=2), encoding="utf-8")
+    _json_dump(outline_data, dst_outline)
     log(f"Created test outline with {len(limited_beats)} beats (from {len(original_beats)} total)")
 
     return TEST_OUTPUT
@@ -137,7 +156,7 @@ def print_prompts_summary(project_path: Path):
         log("No prompts.json found")
         return
 
-    prompts = json.loads(prompts_path.read_text(encoding="utf-8"))
+    prompts = _json_load(prompts_path)
 
     log("="*60)
     log("PROMPTS SUMMARY")
@@ -157,9 +176,10 @@ def print_prompts_summary(project_path: Path):
             issues.append(f"OVER 555 WORDS ({word_count})")
 
         prompt_text = p.get("prompt", "")
-        if "center" in prompt_text.lower() and "thirds" not in prompt_text.lower():
+        hits = {m.group(0).lower() for m in _ISSUE_RE.finditer(prompt_text)}
+        if "center" in hits and "thirds" not in hits:
             issues.append("POSSIBLY CENTERED")
-        if "lattice" in prompt_text.lower() and "obscur" in prompt_text.lower():
+        if "lattice" in hits and "obscur" in hits:
             issues.append("MAY OBSCURE FACE")
 
         status = " | ".join(issues) if issues else "OK"
@@ -177,7 +197,7 @@ def print_world_context_preview(project_path: Path):
     if not world_path.exists():
         return
 
-    world_config = json.loads(world_path.read_text(encoding="utf-8"))
+    world_config = _json_load(world_path)
     context = build_world_context(world_config)
 
     log("="*60)
@@ -200,8 +220,9 @@ async def main():
     log(f"Testing with {NUM_BEATS} beats")
     log("")
 
-    # Setup
-    project_path = setup_test_project()
+    # Setup is pure blocking filesystem work (rmtree, copytree, JSON
+    # write) — run it on a worker thread rather than the event loop
+    project_path = await asyncio.to_thread(setup_test_project)
 
     # Show world context being sent
     print_world_context_preview(project_path)
@@ -211,11 +232,12 @@ async def main():
     if not director_result.get("success"):
         return
 
-    # Show prompts summary
-    print_prompts_summary(project_path)
-
-    # Run storyboard
-    storyboard_result = await run_storyboard(project_path)
+    # Start the storyboard as soon as the visual script is on disk; the
+    # prompts summary is review-only console output, so it renders
+    # (off-thread) while the first images are already generating
+    storyboard_task = asyncio.ensure_future(run_storyboard(project_path))
+    await asyncio.to_thread(print_prompts_summary, project_path)
+    storyboard_result = await storyboard_task
 
     # Final summary
     log("="*60)
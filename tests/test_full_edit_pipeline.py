@@ -18,6 +18,23 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson  # optional: C-extension JSON, ~5-10x stdlib
+except ImportError:
+    orjson = None
+
+
+def _json_dump(obj, path: Path) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_bytes(json.dumps(obj, indent=2).encode("utf-8"))
+
+
+async def _awrite_json(obj, path: Path) -> None:
+    # Serialize + write off-thread so the event loop stays free
+    await asyncio.to_thread(_json_dump, obj, path)
+
 # Fix Windows encoding
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
@@ -101,33 +118,41 @@ async def apply_edits(result, source_dir: Path, output_dir: Path, references_dir
     print(f"\nFrames to edit: {len(frames_to_edit)}")
     print(f"Frames to copy (no issues): {len(frames_to_copy)}")
 
-    # Copy frames with no issues
-    for frame_info in frames_to_copy:
+    # Copy frames with no issues — each copy is blocking disk I/O, so fan
+    # them out to worker threads instead of copying one PNG at a time
+    async def copy_one(frame_info):
         source = frame_info["source_path"]
-        dest = output_dir / f"{frame_info['frame_id']}.png"
         if source.exists():
-            shutil.copy2(source, dest)
+            dest = output_dir / f"{frame_info['frame_id']}.png"
+            await asyncio.to_thread(shutil.copy2, source, dest)
             print(f"[COPY] {frame_info['frame_id']} -> editedboard/")
 
-    # Edit frames with issues
-    edit_results = []
-    for i, frame_info in enumerate(frames_to_edit, 1):
+    if frames_to_copy:
+        await asyncio.gather(*(copy_one(f) for f in frames_to_copy))
+
+    # Edit frames with issues — independent API calls, so run them
+    # concurrently with a bounded gate on in-flight generations
+    sem = asyncio.Semaphore(8)
+
+    async def edit_one(index: int, frame_info: dict) -> dict:
         frame_id = frame_info["frame_id"]
         source_path = frame_info["source_path"]
-        edit_prompts = frame_info["edit_prompts"]
         affected_entities = frame_info["affected_entities"]
 
-        print(f"\n--- Editing {i}/{len(frames_to_edit)}: {frame_id} ---")
-        print(f"  Issues: {len(frame_info['issues'])}")
+        # Buffer this frame's report so concurrent edits don't interleave
+        lines = [
+            f"\n--- Editing {index}/{len(frames_to_edit)}: {frame_id} ---",
+            f"  Issues: {len(frame_info['issues'])}",
+        ]
 
         # Combine edit prompts into one comprehensive instruction
-        combined_prompt = " ".join(edit_prompts)
+        combined_prompt = " ".join(frame_info["edit_prompts"])
 
         # Truncate if too long (Nano Banana Pro has limits)
         if len(combined_prompt) > 2000:
             combined_prompt = combined_prompt[:2000] + "..."
 
-        print(f"  Edit prompt: {combined_prompt[:150]}...")
+        lines.append(f"  Edit prompt: {combined_prompt[:150]}...")
 
         # Gather reference images for affected entities
         reference_images = []
@@ -136,7 +161,7 @@ async def apply_edits(result, source_dir: Path, output_dir: Path, references_dir
             ref_path = references_dir / ref_filename
             if ref_path.exists():
                 reference_images.append(ref_path)
-                print(f"  Reference: {ref_filename}")
+                lines.append(f"  Reference: {ref_filename}")
 
         output_path = output_dir / f"{frame_id}.png"
 
@@ -155,38 +180,47 @@ async def apply_edits(result, source_dir: Path, output_dir: Path, references_dir
                 resolution="2K",
             )
 
-            edit_result = await generator.generate(request)
+            async with sem:
+                edit_result = await generator.generate(request)
 
             if edit_result.success:
-                print(f"  [OK] Edited in {edit_result.generation_time_ms}ms")
-                edit_results.append({
+                lines.append(f"  [OK] Edited in {edit_result.generation_time_ms}ms")
+                record = {
                     "frame_id": frame_id,
                     "success": True,
                     "time_ms": edit_result.generation_time_ms,
-                })
+                }
             else:
-                print(f"  [FAIL] {edit_result.error}")
+                lines.append(f"  [FAIL] {edit_result.error}")
                 # Copy original as fallback
                 if source_path.exists():
-                    shutil.copy2(source_path, output_path)
-                    print(f"  [FALLBACK] Copied original")
-                edit_results.append({
+                    await asyncio.to_thread(shutil.copy2, source_path, output_path)
+                    lines.append(f"  [FALLBACK] Copied original")
+                record = {
                     "frame_id": frame_id,
                     "success": False,
                     "error": edit_result.error,
-                })
+                }
 
         except Exception as e:
-            print(f"  [ERROR] {e}")
+            lines.append(f"  [ERROR] {e}")
             # Copy original as fallback
             if source_path.exists():
-                shutil.copy2(source_path, output_path)
-                print(f"  [FALLBACK] Copied original")
-            edit_results.append({
+                await asyncio.to_thread(shutil.copy2, source_path, output_path)
+                lines.append(f"  [FALLBACK] Copied original")
+            record = {
                 "frame_id": frame_id,
                 "success": False,
                 "error": str(e),
-            })
+            }
+
+        print("\n".join(lines))
+        return record
+
+    edit_results = list(await asyncio.gather(*(
+        edit_one(i, frame_info)
+        for i, frame_info in enumerate(frames_to_edit, 1)
+    )))
 
     return edit_results
 
@@ -223,9 +257,10 @@ async def main():
     if result.total_issues == 0:
         print("\n[INFO] No issues found - copying all frames to editedboard/")
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        for frame_path in source_frames:
-            dest = OUTPUT_DIR / frame_path.name
-            shutil.copy2(frame_path, dest)
+        await asyncio.gather(*(
+            asyncio.to_thread(shutil.copy2, frame_path, OUTPUT_DIR / frame_path.name)
+            for frame_path in source_frames
+        ))
         print(f"Copied {len(source_frames)} frames")
     else:
         # Phase 2: Apply edits
@@ -254,8 +289,7 @@ async def main():
         "entity_references": result.entity_reference_map,
     }
 
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+    await _awrite_json(report, report_path)
 
     print(f"\n[DONE] Pipeline report saved to {report_path}")
     print(f"Edited frames saved to: {OUTPUT_DIR}")
@@ -14,13 +14,16 @@ TEST_CHARACTERS = ["CHAR_MEI", "CHAR_MADAME_CHOU", "CHAR_ZHOA", "CHAR_MIN_ZHU"]
 async def test_regenerate():
     """Regenerate test characters with improved prompts."""
 
-    # Delete existing images first
+    # Delete existing images first — unlink directly and swallow
+    # FileNotFoundError: one syscall per tag, no exists() stat probe
     refs_dir = PROJECT_PATH / "references"
     for tag in TEST_CHARACTERS:
         img_path = refs_dir / f"{tag}.png"
-        if img_path.exists():
-            print(f"Deleting existing: {img_path}")
+        try:
             img_path.unlink()
+            print(f"Deleted existing: {img_path}")
+        except FileNotFoundError:
+            pass
 
     # Create pipeline with flux_2_pro model
     pipeline = ReferencesPipeline(
@@ -4,6 +4,7 @@ Tests: anime, animation_3d, claymation, mixed
 """
 
 import asyncio
+import hashlib
 import json
 import shutil
 from pathlib import Path
@@ -15,6 +16,19 @@ from greenlight.pipelines.references import (
     MEDIA_TYPE_STYLES
 )
 
+try:
+    import orjson  # optional: C-extension JSON, ~5-10x stdlib
+except ImportError:
+    orjson = None
+
+
+async def _aload_json(path: Path):
+    # Read off-thread so the loop stays free; orjson parses the raw
+    # bytes directly, skipping the decode-to-str step
+    raw = await asyncio.to_thread(path.read_bytes)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 PROJECT_PATH = Path(r"C:\Users\thriv\greenlight_projects\orichids_gambit")
 OUTPUT_DIR = Path(r"C:\Users\thriv\Documents\project-greenlight\style_tests")
 
@@ -49,8 +63,14 @@ async def test_style(style: str, char_data: dict, style_notes: str = "") -> Path
 
     print(f"Prompt preview: {prompt[:200]}...")
 
-    # Output path
-    output_path = OUTPUT_DIR / f"madame_chou_{style}.png"
+    # Output path carries a hash of the prompt: a rerun with an unchanged
+    # prompt finds its previous PNG and skips the remote call entirely,
+    # while any prompt edit changes the key and regenerates
+    key = hashlib.sha1(prompt.encode()).hexdigest()[:16]
+    output_path = OUTPUT_DIR / f"madame_chou_{style}.{key}.png"
+    if output_path.exists():
+        print(f"  CACHED: {output_path} (prompt unchanged)")
+        return output_path
 
     # Generate
     generator = ImageGenerator()
@@ -79,7 +99,7 @@ async def main():
 
     # Load character data from world_config
     world_config_path = PROJECT_PATH / "world_bible" / "world_config.json"
-    world_config = json.loads(world_config_path.read_text(encoding="utf-8"))
+    world_config = await _aload_json(world_config_path)
 
     # Find Madame Chou
     char_data = None
@@ -95,19 +115,23 @@ async def main():
     print(f"Character: {char_data.get('name')}")
     print(f"Appearance: {char_data.get('appearance', '')[:100]}...")
 
-    # Test each style
+    # Test all styles at once — each call is pure network wait on the
+    # image model, so the wall clock collapses to the slowest style
+    done = await asyncio.gather(
+        *[test_style(style, char_data) for style in STYLES_TO_TEST],
+        return_exceptions=True,
+    )
+
     results = {}
-    for style in STYLES_TO_TEST:
-        try:
-            output_path = await test_style(style, char_data)
-            results[style] = str(output_path)
-        except Exception as e:
-            print(f"  ERROR testing {style}: {e}")
-            results[style] = f"ERROR: {e}"
-
-    print("\n" + "=" * 50)
-    print("RESULTS SUMMARY")
-    print("=" * 50)
+    for style, outcome in zip(STYLES_TO_TEST, done):
+        if isinstance(outcome, BaseException):
+            print(f"  ERROR testing {style}: {outcome}")
+            results[style] = f"ERROR: {outcome}"
+        else:
+            results[style] = str(outcome)
+
+    banner = "=" * 50
+    print(f"\n{banner}\nRESULTS SUMMARY\n{banner}")
     for style, path in results.items():
         print(f"  {style}: {path}")
 
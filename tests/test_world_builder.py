@@ -5,20 +5,36 @@ Generates world context and entity descriptions from confirmed entities.
 
 import asyncio
 import json
-from pathlib import Path
-
-# Add project to path
+import time
+import traceback
 import sys
-sys.path.insert(0, str(Path(__file__).parent))
+from pathlib import Path
 
 from greenlight.pipelines.world_builder import WorldBuilderPipeline
 from greenlight.core.config import settings
 
+try:
+    import orjson  # optional: C-extension JSON, ~5-10x stdlib
+except ImportError:
+    orjson = None
+
+
+async def _aload_json(path: Path):
+    # Read off-thread so the loop stays free; orjson parses the raw
+    # bytes directly, skipping the decode-to-str step
+    raw = await asyncio.to_thread(path.read_bytes)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+# Banner rules built once; emitting a section header as a single print
+# costs one write instead of three
+_B70 = "=" * 70
+_D70 = "-" * 70
+_BAR40 = "#" * 40 + "-" * 40
+
 
 async def main():
-    print("=" * 70)
-    print("WORLD BUILDER PIPELINE TEST")
-    print("=" * 70)
+    print(f"{_B70}\nWORLD BUILDER PIPELINE TEST\n{_B70}")
 
     # Check API keys
     print("\nAPI Keys Status:")
@@ -43,10 +59,18 @@ async def main():
     def log(msg):
         print(f"  {msg}")
 
+    _last_tick = [0.0]
+
     def progress(p):
-        bar_len = 40
-        filled = int(bar_len * p)
-        bar = "#" * filled + "-" * (bar_len - filled)
+        # Coalesce ticks to <=10 Hz — a chatty pipeline would otherwise
+        # pay a stdout write syscall per fractional update
+        now = time.monotonic()
+        if p < 1.0 and now - _last_tick[0] < 0.1:
+            return
+        _last_tick[0] = now
+
+        filled = int(40 * p)
+        bar = _BAR40[40 - filled:80 - filled]
         print(f"\r  Progress: [{bar}] {p*100:.0f}%", end="", flush=True)
         if p >= 1.0:
             print()
@@ -56,9 +80,7 @@ async def main():
         display_value = value[:60] + "..." if len(value) > 60 else value
         print(f"\n    >> {field_name}: {display_value}")
 
-    print("\n" + "-" * 70)
-    print("Starting World Builder...")
-    print("-" * 70)
+    print(f"\n{_D70}\nStarting World Builder...\n{_D70}")
 
     pipeline = WorldBuilderPipeline(
         project_path=project_path,
@@ -71,9 +93,7 @@ async def main():
     try:
         result = await pipeline.run()
 
-        print("\n" + "-" * 70)
-        print("RESULTS")
-        print("-" * 70)
+        print(f"\n{_D70}\nRESULTS\n{_D70}")
 
         if result["success"]:
             print("\n[OK] World Builder successful!")
@@ -85,73 +105,67 @@ async def main():
             # Load and display world config
             world_config_path = project_path / "world_bible" / "world_config.json"
             if world_config_path.exists():
-                world_config = json.loads(world_config_path.read_text())
-
-                print("\n" + "=" * 70)
-                print("WORLD CONTEXT")
-                print("=" * 70)
+                world_config = await _aload_json(world_config_path)
 
+                # Bind the top-level sections once, then build the whole
+                # dump into one buffer — a single stdout write instead of
+                # a print per field
                 wc = world_config.get("world_context", {})
+                characters = world_config.get("characters", [])
+                locations = world_config.get("locations", [])
+                props = world_config.get("props", [])
+                rule = "-" * 40
+
+                out = [f"\n{_B70}\nWORLD CONTEXT\n{_B70}"]
                 for field, value in wc.items():
                     if value and field != "setting_rules":
-                        print(f"\n{field.upper().replace('_', ' ')}:")
-                        print(f"  {value}")
-
-                print("\n" + "=" * 70)
-                print("CHARACTERS")
-                print("=" * 70)
-
-                for char in world_config.get("characters", []):
-                    print(f"\n{char.get('name')} ({char.get('tag')}) - {char.get('role', 'unknown')}")
-                    print("-" * 40)
-                    if char.get("appearance"):
-                        print(f"  Appearance: {char['appearance']}")
-                    if char.get("clothing"):
-                        print(f"  Clothing: {char['clothing']}")
-                    if char.get("personality"):
-                        print(f"  Personality: {char['personality']}")
-                    if char.get("summary"):
-                        print(f"  Summary: {char['summary']}")
-
-                print("\n" + "=" * 70)
-                print("LOCATIONS")
-                print("=" * 70)
-
-                for loc in world_config.get("locations", []):
-                    print(f"\n{loc.get('name')} ({loc.get('tag')})")
-                    print("-" * 40)
-                    if loc.get("description"):
-                        print(f"  Description: {loc['description']}")
-                    if loc.get("view_north"):
-                        print(f"  View North: {loc['view_north']}")
-                    if loc.get("view_east"):
-                        print(f"  View East: {loc['view_east']}")
-                    if loc.get("view_south"):
-                        print(f"  View South: {loc['view_south']}")
-                    if loc.get("view_west"):
-                        print(f"  View West: {loc['view_west']}")
-
-                print("\n" + "=" * 70)
-                print("PROPS")
-                print("=" * 70)
-
-                for prop in world_config.get("props", []):
-                    print(f"\n{prop.get('name')} ({prop.get('tag')})")
-                    print("-" * 40)
+                        out.append(f"\n{field.upper().replace('_', ' ')}:")
+                        out.append(f"  {value}")
+
+                out.append(f"\n{_B70}\nCHARACTERS\n{_B70}")
+                for char in characters:
+                    out.append(f"\n{char.get('name')} ({char.get('tag')}) - {char.get('role', 'unknown')}")
+                    out.append(rule)
+                    for label, field in (
+                        ("Appearance", "appearance"),
+                        ("Clothing", "clothing"),
+                        ("Personality", "personality"),
+                        ("Summary", "summary"),
+                    ):
+                        if char.get(field):
+                            out.append(f"  {label}: {char[field]}")
+
+                out.append(f"\n{_B70}\nLOCATIONS\n{_B70}")
+                for loc in locations:
+                    out.append(f"\n{loc.get('name')} ({loc.get('tag')})")
+                    out.append(rule)
+                    for label, field in (
+                        ("Description", "description"),
+                        ("View North", "view_north"),
+                        ("View East", "view_east"),
+                        ("View South", "view_south"),
+                        ("View West", "view_west"),
+                    ):
+                        if loc.get(field):
+                            out.append(f"  {label}: {loc[field]}")
+
+                out.append(f"\n{_B70}\nPROPS\n{_B70}")
+                for prop in props:
+                    out.append(f"\n{prop.get('name')} ({prop.get('tag')})")
+                    out.append(rule)
                     if prop.get("description"):
-                        print(f"  Description: {prop['description']}")
+                        out.append(f"  Description: {prop['description']}")
+
+                sys.stdout.write("\n".join(out) + "\n")
 
         else:
             print(f"\n[FAIL] World Builder failed: {result.get('error', 'Unknown error')}")
 
     except Exception as e:
         print(f"\n[ERROR] {e}")
-        import traceback
         traceback.print_exc()
 
-    print("\n" + "=" * 70)
-    print("TEST COMPLETE")
-    print("=" * 70)
+    print(f"\n{_B70}\nTEST COMPLETE\n{_B70}")
 
 
 if __name__ == "__main__":